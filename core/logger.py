@@ -1,23 +1,35 @@
 import logging
 import os
+import threading
 from datetime import datetime
 
+# Names already given handlers; checked before taking the lock so repeat
+# calls (e.g. every get_session()) return straight away
+_configured = set()
+_configure_lock = threading.Lock()
+
 def setup_logger(name):
-    logger = logging.getLogger(name)
+    if name in _configured:
+        return logging.getLogger(name)
     
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        
-        os.makedirs('logs', exist_ok=True)
-        
-        handler = logging.FileHandler(f'logs/{name}_{datetime.now().strftime("%Y%m%d")}.log')
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
+    with _configure_lock:
+        logger = logging.getLogger(name)
         
-        logger.addHandler(handler)
+        if name not in _configured and not logger.handlers:
+            logger.setLevel(logging.INFO)
+            
+            os.makedirs('logs', exist_ok=True)
+            
+            handler = logging.FileHandler(f'logs/{name}_{datetime.now().strftime("%Y%m%d")}.log')
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            
+            logger.addHandler(handler)
+            
+            console = logging.StreamHandler()
+            console.setFormatter(formatter)
+            logger.addHandler(console)
         
-        console = logging.StreamHandler()
-        console.setFormatter(formatter)
-        logger.addHandler(console)
+        _configured.add(name)
     
-    return logger
\ No newline at end of file
+    return logger
@@ -7,7 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 import argparse
 import time
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from models import get_session
 from etl.clients.fanduel_client import FanDuelClient
@@ -25,6 +25,7 @@ class FanDuelLoader:
         # Stats tracking
         self.stats = {
             'start_time': None,
+            'fetched_at': None,
             'events_found': 0,
             'markets_found': 0,
             'prices_fetched': 0,
@@ -34,11 +35,15 @@ class FanDuelLoader:
             'errors': 0
         }
     
-    def load_all_markets(self, fetch_prices: bool = True):
-        """Load all FanDuel markets and optionally fetch prices"""
+    def load_all_markets(self, fetch_prices: bool = True, fetched_at: datetime = None):
+        """
+        Load all FanDuel markets and optionally fetch prices. fetched_at is
+        the price snapshot time; pass the failed run's value to retry it
+        """
         
         logger.info("Starting FanDuel complete market load")
         self.stats['start_time'] = time.time()
+        self.stats['fetched_at'] = fetched_at or datetime.now(timezone.utc)
         
         try:
             # Step 1: Fetch MLB page with all markets
@@ -71,7 +76,7 @@ class FanDuelLoader:
                 prices_data = self.client.fetch_market_prices(market_ids)
                 
                 if prices_data:
-                    prices_count = self.processor.process_market_prices(prices_data)
+                    prices_count = self.processor.process_market_prices(prices_data, self.stats['fetched_at'])
                     self.stats['prices_fetched'] = prices_count
                     logger.info(f"Stored {prices_count} price records")
                 else:
@@ -82,11 +87,13 @@ class FanDuelLoader:
                 self._log_final_results()
                 return True
             else:
+                logger.error(f"Retry with --fetched-at {self.stats['fetched_at'].isoformat()} to reuse this snapshot")
                 self.stats['errors'] += 1
                 return False
             
         except Exception as e:
             logger.error(f"Error in FanDuel loading process: {e}")
+            logger.error(f"Retry with --fetched-at {self.stats['fetched_at'].isoformat()} to reuse this snapshot")
             self.stats['errors'] += 1
             return False
     
@@ -126,6 +133,12 @@ def main():
         help='Skip fetching current prices (only load market structure)'
     )
     
+    parser.add_argument(
+        '--fetched-at',
+        type=datetime.fromisoformat,
+        help='Price snapshot time (ISO 8601 with UTC offset) to reuse when retrying a failed scrape'
+    )
+    
     args = parser.parse_args()
     
     # Set up logging
@@ -138,7 +151,7 @@ def main():
     
     try:
         # Load all markets (with or without prices)
-        success = loader.load_all_markets(fetch_prices=not args.no_prices)
+        success = loader.load_all_markets(fetch_prices=not args.no_prices, fetched_at=args.fetched_at)
         return 0 if success else 1
         
     except Exception as e:
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from sqlalchemy import and_
+from sqlalchemy import case, func
 import logging
 
 from models import Game, get_session
@@ -17,23 +17,14 @@ class DateManager:
  
         session = get_session()
         try:
-            # Get all dates that have games
-            dates_with_games = session.query(Game.official_date).distinct().order_by(Game.official_date.desc()).all()
+            # Count total and Final games for every date in one grouped query
+            date_counts = session.query(
+                Game.official_date,
+                func.count(),
+                func.count(case((Game.status_detailed.in_(['Final', 'F']), 1)))
+            ).group_by(Game.official_date).order_by(Game.official_date.desc()).all()
             
-            for date_tuple in dates_with_games:
-                date_to_check = date_tuple[0]
-                
-                # Count total games on this date
-                total_games = session.query(Game).filter(Game.official_date == date_to_check).count()
-                
-                # Count Final games on this date
-                final_games = session.query(Game).filter(
-                    and_(
-                        Game.official_date == date_to_check,
-                        Game.status_detailed.in_(['Final', 'F'])
-                    )
-                ).count()
-                
+            for date_to_check, total_games, final_games in date_counts:
                 logger.debug(f"Date {date_to_check}: {final_games}/{total_games} games Final")
                 
                 # If ALL games on this date are Final, this is our last complete date
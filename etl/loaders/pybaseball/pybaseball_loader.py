@@ -3,6 +3,7 @@
 import sys
 import logging
 import time
+import concurrent.futures
 from datetime import datetime
 
 from etl.clients.pybaseball_client import PybaseballClient
@@ -35,26 +36,22 @@ class PybaseballStatcastLoader:
             processor = PybaseballProcessor()
             
             # Get player classifications
-            batters, pitchers = processor.get_player_classifications()
+            batters, pitchers = processor.player_classifications
             self.stats['batters_classified'] = len(batters)
             self.stats['pitchers_classified'] = len(pitchers)
             
-            # Fetch and process batter data
-            batter_data = self.client.get_batter_data(year)
-            processor.process_batter_data(batter_data, batters)
+            # Batter and pitcher phases touch disjoint tables and each opens its
+            # own connection, so fetch and load them side by side. The
+            # classifications are resolved above and handed to each phase, so
+            # neither thread touches the processor's cached property
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                batter_future = executor.submit(self._load_batters, processor, year, batters)
+                pitcher_future = executor.submit(self._load_pitchers, processor, year, pitchers)
+                
+                # Each phase returns its own count; merged here once both finish
+                self.stats['batter_records_loaded'] = batter_future.result()
+                self.stats['pitcher_records_loaded'] = pitcher_future.result()
             
-            # Update stats
-            batter_stats = processor.get_stats()
-            self.stats['batter_records_loaded'] = batter_stats['batters_processed']
-            self.stats['total_records_loaded'] = self.stats['batter_records_loaded']
-            
-            # Fetch and process pitcher data
-            pitcher_data = self.client.get_pitcher_data(year)
-            processor.process_pitcher_data(pitcher_data, pitchers)
-            
-            # Update stats
-            final_stats = processor.get_stats()
-            self.stats['pitcher_records_loaded'] = final_stats['pitchers_processed']
             self.stats['total_records_loaded'] = self.stats['batter_records_loaded'] + self.stats['pitcher_records_loaded']
             
             # Log final results
@@ -68,6 +65,16 @@ class PybaseballStatcastLoader:
         finally:
             processor.close()
     
+    def _load_batters(self, processor, year, batters):
+
+        batter_data = self.client.get_batter_data(year)
+        return processor.process_batter_data(batter_data, batters)
+    
+    def _load_pitchers(self, processor, year, pitchers):
+
+        pitcher_data = self.client.get_pitcher_data(year)
+        return processor.process_pitcher_data(pitcher_data, pitchers)
+    
     def _log_final_results(self):
         elapsed = time.time() - self.stats['start_time']
         
@@ -7,7 +7,7 @@ import time
 import logging
 from datetime import datetime
 
-from models import get_session
+from models import get_session, PlayerSplits, PitcherSplits
 from etl.clients.mlb_splits_client import MLBSplitsClient
 from etl.processors.splits.splits_processor import SplitsProcessor
 
@@ -129,7 +129,8 @@ class MLBSplitsLoader:
                 return False, 0
             
             # Bulk upsert to database
-            loaded_count = processor.bulk_upsert_splits(splits_records)
+            model = PlayerSplits if group == 'hitting' else PitcherSplits
+            loaded_count = processor.bulk_upsert_splits(splits_records, model)
             processor.close()
             
             return loaded_count > 0, len(splits_records)
@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 from models import Game, EspnOdds, get_session
 
@@ -315,7 +315,7 @@ class ESPNBettingProcessor:
                         for key, value in odds_data.items():
                             if key not in ['espn_game_id'] and hasattr(existing_odds, key):
                                 setattr(existing_odds, key, value)
-                        existing_odds.updated_at = datetime.now()
+                        existing_odds.updated_at = func.now()
                         updated += 1
                     else:
                         # Create new record
@@ -331,9 +331,7 @@ class ESPNBettingProcessor:
                             final_line=str(odds_data.get('final_line')) if odds_data.get('final_line') else None,
                             final_odds=str(odds_data.get('final_odds')) if odds_data.get('final_odds') else None,
                             outcome=odds_data.get('outcome'),
-                            provider_name=odds_data.get('provider_name', 'ESPN BET'),
-                            created_at=datetime.now(),
-                            updated_at=datetime.now()
+                            provider_name=odds_data.get('provider_name', 'ESPN BET')
                         )
                         self.session.add(new_odds)
                         created += 1
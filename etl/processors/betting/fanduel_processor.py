@@ -4,10 +4,11 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from decimal import Decimal
+from sqlalchemy import func
 
 from models import (
     FanDuelBook, FanDuelEvent, FanDuelMarket, 
-    FanDuelRunner, FanDuelPrice, get_session
+    FanDuelRunner, FanDuelPrice, get_session, bulk_insert_rows
 )
 
 logger = logging.getLogger(__name__)
@@ -86,7 +87,7 @@ class FanDuelProcessor:
                     existing.event_name = event_data.get('name')
                     existing.open_date = open_date
                     existing.status = 'OPEN' if not event_data.get('isSuspended') else 'SUSPENDED'
-                    existing.updated_at = datetime.now()
+                    existing.updated_at = func.now()
                 else:
                     # Create new event
                     event = FanDuelEvent(
@@ -151,7 +152,7 @@ class FanDuelProcessor:
                     existing.in_play = market_data.get('inPlay', False)
                     existing.market_category = market_category
                     existing.market_key = market_key
-                    existing.updated_at = datetime.now()
+                    existing.updated_at = func.now()
                 else:
                     # Create new market
                     market = FanDuelMarket(
@@ -209,7 +210,7 @@ class FanDuelProcessor:
                     existing.handicap = handicap
                     existing.runner_status = runner_data.get('runnerStatus', 'OPEN')
                     existing.sort_priority = runner_data.get('sortPriority')
-                    existing.updated_at = datetime.now()
+                    existing.updated_at = func.now()
                 else:
                     # Create new runner
                     runner = FanDuelRunner(
@@ -229,13 +230,18 @@ class FanDuelProcessor:
                 logger.error(f"Error processing runner: {e}")
                 self.stats['errors'] += 1
     
-    def process_market_prices(self, prices_data: List[Dict]) -> int:
-        """Process and store market prices"""
+    def process_market_prices(self, prices_data: List[Dict], fetched_at: datetime) -> int:
+        """
+        Process and store market prices as one snapshot taken at fetched_at.
+        Callers set fetched_at once per scrape and pass the same value on a
+        retry, so rows already stored are skipped instead of duplicated.
+        Returns the number of price rows inserted
+        """
         
         if not prices_data:
             return 0
         
-        count = 0
+        price_rows = []
         
         for market_price in prices_data:
             try:
@@ -262,26 +268,26 @@ class FanDuelProcessor:
                     # Extract odds
                     win_runner_odds = runner_price.get('winRunnerOdds', {})
                     
-                    # Create price record
-                    price = FanDuelPrice(
-                        market_id=market.id,
-                        runner_id=runner.id if runner else None,
-                        selection_id=selection_id,
-                        american_odds=win_runner_odds.get('americanDisplayOdds', {}).get('americanOdds'),
-                        decimal_odds=Decimal(str(win_runner_odds.get('decimalDisplayOdds', {}).get('decimalOdds', 0))) if win_runner_odds.get('decimalDisplayOdds') else None,
-                        fractional_numerator=win_runner_odds.get('fractionalDisplayOdds', {}).get('numerator'),
-                        fractional_denominator=win_runner_odds.get('fractionalDisplayOdds', {}).get('denominator'),
-                        true_decimal_odds=Decimal(str(win_runner_odds.get('trueOdds', {}).get('decimalOdds', {}).get('decimalOdds', 0))) if win_runner_odds.get('trueOdds') else None,
-                        line=runner.handicap if runner else None,
-                        in_play=market_price.get('inplay', False)
-                    )
-                    self.session.add(price)
-                    count += 1
+                    # Collect price row; inserted in bulk below
+                    price_rows.append({
+                        'market_id': market.id,
+                        'runner_id': runner.id if runner else None,
+                        'selection_id': selection_id,
+                        'american_odds': win_runner_odds.get('americanDisplayOdds', {}).get('americanOdds'),
+                        'decimal_odds': Decimal(str(win_runner_odds.get('decimalDisplayOdds', {}).get('decimalOdds', 0))) if win_runner_odds.get('decimalDisplayOdds') else None,
+                        'fractional_numerator': win_runner_odds.get('fractionalDisplayOdds', {}).get('numerator'),
+                        'fractional_denominator': win_runner_odds.get('fractionalDisplayOdds', {}).get('denominator'),
+                        'true_decimal_odds': Decimal(str(win_runner_odds.get('trueOdds', {}).get('decimalOdds', {}).get('decimalOdds', 0))) if win_runner_odds.get('trueOdds') else None,
+                        'line': runner.handicap if runner else None,
+                        'in_play': market_price.get('inplay', False),
+                        'fetched_at': fetched_at
+                    })
                     
             except Exception as e:
                 logger.error(f"Error processing price: {e}")
                 self.stats['errors'] += 1
         
+        count = bulk_insert_rows(self.session, FanDuelPrice, price_rows, skip_conflicts=True)
         self.stats['prices_processed'] += count
         return count
     
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func
 
 from models import (
     PrizePicksPlayer, PrizePicksTeam, PrizePicksGame, 
@@ -68,7 +69,7 @@ class PrizePicksProcessor:
                     existing.position = attrs.get('position')
                     existing.jersey_number = attrs.get('jersey_number')
                     existing.image_url = attrs.get('image_url')
-                    existing.updated_at = datetime.now()
+                    existing.updated_at = func.now()
                 else:
                     # Create new player
                     player = PrizePicksPlayer(
@@ -107,7 +108,7 @@ class PrizePicksProcessor:
                     existing.team_code = attrs.get('team')
                     existing.team_name = attrs.get('name')
                     existing.market = attrs.get('market')
-                    existing.updated_at = datetime.now()
+                    existing.updated_at = func.now()
                 else:
                     # Create new team
                     team = PrizePicksTeam(
@@ -151,7 +152,7 @@ class PrizePicksProcessor:
                     existing.external_game_id = attrs.get('game_id')
                     existing.start_time = start_time
                     existing.status = attrs.get('status')
-                    existing.updated_at = datetime.now()
+                    existing.updated_at = func.now()
                 else:
                     # Create new game
                     game = PrizePicksGame(
@@ -234,7 +235,7 @@ class PrizePicksProcessor:
                     existing.is_live = attrs.get('is_live', False)
                     existing.is_promo = attrs.get('is_promo', False)
                     existing.odds_type = attrs.get('odds_type')
-                    existing.last_updated = datetime.now()
+                    existing.last_updated = datetime.now(timezone.utc)
                     
                     # Update player/game if found
                     if player:
@@ -253,7 +254,7 @@ class PrizePicksProcessor:
                         status=attrs.get('status'),
                         start_time=start_time,
                         board_time=board_time,
-                        last_updated=datetime.now(),
+                        last_updated=datetime.now(timezone.utc),
                         is_live=attrs.get('is_live', False),
                         is_promo=attrs.get('is_promo', False),
                         odds_type=attrs.get('odds_type'),
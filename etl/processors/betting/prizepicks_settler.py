@@ -4,10 +4,6 @@ PrizePicks Settlement Processor
 Settles completed projections by comparing to actual box score results
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
-
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Optional, List
@@ -282,9 +278,6 @@ class PrizePicksSettler:
 
 def main():
     """Run settlement for recent projections"""
-    import sys
-    sys.path.append('/home/highs/mlb-scraping-dashboardv2')
-    
     from core.logger import setup_logger
     setup_logger('prizepicks_settler')
     
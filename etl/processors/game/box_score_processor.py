@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import logging
-from datetime import datetime
 from typing import Dict, Any
 
 from models import BoxScore, get_session
@@ -48,10 +47,8 @@ class BoxScoreProcessor:
             
             return True
             
-        except Exception as e:
-            logger.error(f"Error processing box scores: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error processing box scores")
             return False
     
     def _process_player_box_score(self, player_data: Dict, player_key: str, team_type: str, game_pk: int):
@@ -123,8 +120,7 @@ class BoxScoreProcessor:
             team_type=team_type,
             player_name=player_name,
             position=position,
-            batting_order=batting_order,
-            created_at=datetime.now()
+            batting_order=batting_order
         )
         
         # Add batting stats
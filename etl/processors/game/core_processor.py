@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from models import Game, Venue, GameLineScore, get_session
+from models import Game, Venue, GameLineScore, get_session, uuid_key
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +118,7 @@ class CoreGameProcessor:
             
             game = Game(
                 game_pk=game_pk,
-                game_guid=scoreboard.get('gameGuid') or game_data.get('game_guid') or f"mlb-{game_pk}-{game_date.strftime('%Y%m%d')}",
+                game_guid=uuid_key(scoreboard.get('gameGuid') or game_data.get('game_guid') or f"mlb-{game_pk}-{game_date.strftime('%Y%m%d')}"),
                 season="2025",
                 game_type=game_data.get('gamedayType', 'S'),
                 game_date=game_date,
@@ -143,9 +143,7 @@ class CoreGameProcessor:
                 home_hits=home_team.get('hits'),
                 away_hits=away_team.get('hits'),
                 home_errors=home_team.get('errors'),
-                away_errors=away_team.get('errors'),
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                away_errors=away_team.get('errors')
             )
             
             self.session.add(game)
@@ -175,9 +173,7 @@ class CoreGameProcessor:
             
             venue = Venue(
                 mlb_id=venue_id,
-                name=venue_name,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                name=venue_name
             )
             
             self.session.add(venue)
@@ -211,8 +207,7 @@ class CoreGameProcessor:
                         runs=home_data.get('runs', 0),
                         hits=home_data.get('hits', 0),
                         errors=home_data.get('errors', 0),
-                        left_on_base=home_data.get('leftOnBase', 0),
-                        created_at=datetime.now()
+                        left_on_base=home_data.get('leftOnBase', 0)
                     )
                     self.session.add(home_line)
                     self.stats['line_scores_loaded'] += 1
@@ -227,8 +222,7 @@ class CoreGameProcessor:
                         runs=away_data.get('runs', 0),
                         hits=away_data.get('hits', 0),
                         errors=away_data.get('errors', 0),
-                        left_on_base=away_data.get('leftOnBase', 0),
-                        created_at=datetime.now()
+                        left_on_base=away_data.get('leftOnBase', 0)
                     )
                     self.session.add(away_line)
                     self.stats['line_scores_loaded'] += 1
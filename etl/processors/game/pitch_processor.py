@@ -1,12 +1,23 @@
 #!/usr/bin/env python3
 
 import logging
-from datetime import datetime
 
-from models import StatcastPitch, BattedBall, get_session
+from models import Game, StatcastPitch, BattedBall, get_session, uuid_key
 
 logger = logging.getLogger(__name__)
 
+def _inning_half(pitch_data, home_abbreviation):
+    """'top' or 'bottom' for a Savant pitch: from inning_topbot when present,
+    else whether the home team is batting"""
+    topbot = pitch_data.get('inning_topbot')
+    if topbot:
+        return 'top' if topbot.lower().startswith('top') else 'bottom'
+    if pitch_data.get('team_batting') == home_abbreviation:
+        return 'bottom'
+    if pitch_data.get('team_fielding') == home_abbreviation:
+        return 'top'
+    return None
+
 class PitchDataProcessor:
     """Handles pitch-by-pitch and batted ball data processing"""
     
@@ -34,6 +45,22 @@ class PitchDataProcessor:
     def _load_pitch_data(self, game_data, game_pk):
         """Load all pitch-by-pitch data"""
         try:
+            # Season, date and team keys are copied onto every pitch from the
+            # game row the core processor just added
+            game = self.session.get(Game, game_pk)
+            if game is None:
+                logger.error(f"Game {game_pk} not loaded; skipping pitch data")
+                return False
+            game_keys = {
+                'season': int(game.season),
+                'game_date': game.official_date
+            }
+            # (pitcher_team_id, batter_team_id) by inning half
+            team_ids = {
+                'top': (game.home_team_id, game.away_team_id),
+                'bottom': (game.away_team_id, game.home_team_id)
+            }
+            
             for player_id, player_pitches in game_data.items():
                 if not isinstance(player_pitches, list):
                     continue
@@ -42,23 +69,30 @@ class PitchDataProcessor:
                     if not isinstance(pitch_data, dict):
                         continue
                     
-                    pitch_id = pitch_data.get('play_id', f"{game_pk}_{pitch_data.get('pitch_number', 0)}")
+                    pitch_id = uuid_key(pitch_data.get('play_id', f"{game_pk}_{pitch_data.get('pitch_number', 0)}"))
                     
                     # Check if pitch exists
                     existing_pitch = self.session.query(StatcastPitch).filter_by(pitch_id=pitch_id).first()
                     if existing_pitch:
                         continue
                     
+                    # Unknown half: leave the team columns empty rather than guess
+                    inning_half = _inning_half(pitch_data, game.home_team_abbreviation)
+                    pitcher_team_id, batter_team_id = team_ids.get(inning_half, (None, None))
+                    
                     # Create pitch record with correct field mappings
                     pitch = StatcastPitch(
                         pitch_id=pitch_id,
                         game_pk=game_pk,
+                        **game_keys,
+                        pitcher_team_id=pitcher_team_id,
+                        batter_team_id=batter_team_id,
                         ab_number=pitch_data.get('ab_number'),
                         pitch_number=pitch_data.get('pitch_number'),
                         pitcher_id=pitch_data.get('pitcher'),
                         batter_id=pitch_data.get('batter'),
                         inning=pitch_data.get('inning'),
-                        inning_half='top' if pitch_data.get('team_batting') != pitch_data.get('team_fielding') else 'bottom',
+                        inning_half=inning_half,
                         strikes=pitch_data.get('strikes'),
                         balls=pitch_data.get('balls'),
                         outs=pitch_data.get('outs'),
@@ -82,8 +116,7 @@ class PitchDataProcessor:
                         release_spin_rate=pitch_data.get('spin_rate'),
                         pitch_result=pitch_data.get('call_name'),
                         play_result=pitch_data.get('result'),
-                        zone=pitch_data.get('zone'),
-                        created_at=datetime.now()
+                        zone=pitch_data.get('zone')
                     )
                     
                     self.session.add(pitch)
@@ -94,10 +127,13 @@ class PitchDataProcessor:
                         batted_ball = BattedBall(
                             play_id=pitch_id,
                             game_pk=game_pk,
+                            **game_keys,
+                            pitcher_team_id=pitcher_team_id,
+                            batter_team_id=batter_team_id,
                             batter_id=pitch_data.get('batter'),
                             pitcher_id=pitch_data.get('pitcher'),
                             inning=pitch_data.get('inning'),
-                            inning_half='top' if pitch_data.get('team_batting') != pitch_data.get('team_fielding') else 'bottom',
+                            inning_half=inning_half,
                             # Field mappings based on API response
                             exit_velocity=pitch_data.get('hit_speed'),
                             launch_angle=pitch_data.get('hit_angle'),
@@ -107,8 +143,7 @@ class PitchDataProcessor:
                             hit_coord_x=pitch_data.get('hc_x'),
                             hit_coord_y=pitch_data.get('hc_y'),
                             result=pitch_data.get('result'),
-                            bb_type=pitch_data.get('call_name'),
-                            created_at=datetime.now()
+                            bb_type=pitch_data.get('call_name')
                         )
                         
                         self.session.add(batted_ball)
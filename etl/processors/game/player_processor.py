@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import logging
-from datetime import datetime
 
 from models import Player, get_session
 
@@ -26,10 +25,8 @@ class PlayerDataProcessor:
             self._load_all_players(game_data)
             return True
             
-        except Exception as e:
-            logger.error(f"Error processing player data: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error processing player data")
             return False
         
     def _load_all_players(self, game_data):
@@ -97,9 +94,7 @@ class PlayerDataProcessor:
                             active=True,  # Assume active since they're playing
                             primary_position_name=primary_position_name,
                             bat_side_code=bat_side,
-                            pitch_hand_code=pitch_hand,
-                            created_at=datetime.now(),
-                            updated_at=datetime.now()
+                            pitch_hand_code=pitch_hand
                         )
                         
                         self.session.add(player)
@@ -111,10 +106,8 @@ class PlayerDataProcessor:
             logger.debug(f"Loaded {self.stats['players_loaded']} new players from boxscore data")
             return True
             
-        except Exception as e:
-            logger.error(f"Error loading players: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error loading players")
             return False
     
     def _validate_player_data(self, mlb_id: int, full_name: str) -> bool:
@@ -1,12 +1,88 @@
 #!/usr/bin/env python3
 
 import logging
-from datetime import datetime
 
-from models import Game, PlayerSeasonStats, TeamSeasonStats, get_session
+from models import Game, PlayerSeasonStats, TeamSeasonStats, bulk_upsert_rows, get_session
 
 logger = logging.getLogger(__name__)
 
+# Current season
+SEASON = 2025
+
+# Columns the API reports as innings strings ('123.1' = 123 1/3), stored
+# as whole outs
+OUTS_COLUMNS = ('outs_pitched', 'outs_fielded')
+
+# (model column, API stat key, float) per season stat group; floats go
+# through _clean_float to drop the API's '-.--' placeholders
+PITCHING_FIELDS = (
+    ('pitching_games_played', 'gamesPlayed', False),
+    ('games_started', 'gamesStarted', False),
+    ('complete_games', 'completeGames', False),
+    ('shutouts', 'shutouts', False),
+    ('wins', 'wins', False),
+    ('losses', 'losses', False),
+    ('saves', 'saves', False),
+    ('save_opportunities', 'saveOpportunities', False),
+    ('holds', 'holds', False),
+    ('blown_saves', 'blownSaves', False),
+    ('outs_pitched', 'inningsPitched', False),
+    ('hits_allowed', 'hits', False),
+    ('runs_allowed', 'runs', False),
+    ('earned_runs', 'earnedRuns', False),
+    ('home_runs_allowed', 'homeRuns', False),
+    ('walks_allowed', 'baseOnBalls', False),
+    ('hit_batsmen', 'hitBatsmen', False),
+    ('pitcher_strikeouts', 'strikeOuts', False),
+    ('wild_pitches', 'wildPitches', False),
+    ('balks', 'balks', False),
+    ('era', 'era', True),
+    ('whip', 'whip', True),
+    ('batters_faced', 'battersFaced', False),
+    ('pitches_thrown', 'pitchesThrown', False),
+    ('strikes', 'strikes', False),
+    ('balls', 'balls', False),
+    ('strike_percentage', 'strikePercentage', True)
+)
+
+BATTING_FIELDS = (
+    ('batting_games_played', 'gamesPlayed', False),
+    ('at_bats', 'atBats', False),
+    ('runs', 'runs', False),
+    ('hits', 'hits', False),
+    ('doubles', 'doubles', False),
+    ('triples', 'triples', False),
+    ('home_runs', 'homeRuns', False),
+    ('rbi', 'rbi', False),
+    ('walks', 'baseOnBalls', False),
+    ('strikeouts', 'strikeOuts', False),
+    ('stolen_bases', 'stolenBases', False),
+    ('caught_stealing', 'caughtStealing', False),
+    ('batting_avg', 'avg', True),
+    ('on_base_pct', 'obp', True),
+    ('slugging_pct', 'slg', True),
+    ('ops', 'ops', True),
+    ('plate_appearances', 'plateAppearances', False),
+    ('hit_by_pitch', 'hitByPitch', False),
+    ('sac_flies', 'sacFlies', False),
+    ('sac_bunts', 'sacBunts', False),
+    ('intentional_walks', 'intentionalWalks', False),
+    ('ground_into_double_play', 'groundIntoDoublePlay', False),
+    ('total_bases', 'totalBases', False)
+)
+
+FIELDING_FIELDS = (
+    ('fielding_games', 'games', False),
+    ('fielding_games_started', 'gamesStarted', False),
+    ('outs_fielded', 'innings', False),
+    ('putouts', 'putOuts', False),
+    ('assists', 'assists', False),
+    ('errors', 'errors', False),
+    ('double_plays', 'doublePlays', False),
+    ('fielding_percentage', 'fielding', True),
+    ('range_factor', 'rangeFactor', True)
+)
+
 class SeasonStatsProcessor:
     """Handles player season stats and team season records"""
     
@@ -52,10 +128,8 @@ class SeasonStatsProcessor:
             
             return True
             
-        except Exception as e:
-            logger.error(f"Error processing season stats: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error processing season stats")
             return False
     
     def _should_update_team_stats(self, team_id, current_game_pk):
@@ -87,10 +161,7 @@ class SeasonStatsProcessor:
             teams = boxscore.get('teams', {})
             team_data = teams.get(team_type, {})
             
-            # Get team info
-            team_info = team_data.get('team', {})
-            
-            # Get team ID from top level if not in team_info
+            # Get team ID from top level
             if team_type == 'home':
                 team_id = game_data.get('team_home_id')
             else:
@@ -100,78 +171,59 @@ class SeasonStatsProcessor:
                 logger.warning(f"No valid team ID found for {team_type} team")
                 return
             
-            # Extract team info
-            season = 2025  # Current season
-            team_name = team_data.get('name', '')
-            abbreviation = team_data.get('abbreviation', '')
-            club_name = team_data.get('clubName', '')
-            location_name = team_data.get('locationName', '')
-            
             # League/Division info
             league_info = team_data.get('league', {})
             division_info = team_data.get('division', {})
             
             # Season record from team_data.record or seasonStats
             record = team_data.get('record', {})
+            league_record = record.get('leagueRecord', {})
             
-            # Check if team season stats already exist
-            existing_stats = self.session.query(TeamSeasonStats).filter_by(
-                team_id=team_id, 
-                season=season
-            ).first()
-            
-            if existing_stats:
-                # Update existing record
-                team_stats = existing_stats
-                logger.debug(f"Updating existing team season stats for {team_name}")
-            else:
-                # Create new record
-                team_stats = TeamSeasonStats(team_id=team_id, season=season)
-                logger.debug(f"Creating new team season stats for {team_name}")
-                self.session.add(team_stats)
-            
-            # Update team information
-            team_stats.team_name = team_name
-            team_stats.team_abbreviation = abbreviation
-            team_stats.club_name = club_name
-            team_stats.location_name = location_name
-            
-            # League/Division
-            team_stats.league_id = league_info.get('id')
-            team_stats.league_name = league_info.get('name')
-            team_stats.division_id = division_info.get('id')
-            team_stats.division_name = division_info.get('name')
-            
-            # Season record
-            team_stats.wins = record.get('wins', 0)
-            team_stats.losses = record.get('losses', 0)
-            team_stats.ties = record.get('ties', 0)
-            team_stats.winning_percentage = record.get('pct', 0.0)
-            team_stats.games_played = (team_stats.wins or 0) + (team_stats.losses or 0) + (team_stats.ties or 0)
-            
-            # Division standings
-            team_stats.division_rank = record.get('divisionRank')
-            team_stats.games_back_division = record.get('gamesBack')
-            team_stats.is_division_leader = (team_stats.division_rank == 1)
+            wins = record.get('wins', 0)
+            losses = record.get('losses', 0)
+            division_rank = record.get('divisionRank')
             
-            # League record
-            league_record = record.get('leagueRecord', {})
-            team_stats.league_wins = league_record.get('wins')
-            team_stats.league_losses = league_record.get('losses')
-            team_stats.league_pct = league_record.get('pct')
+            team_row = {
+                'team_id': team_id,
+                'season': SEASON,
+                
+                # Team information
+                'team_name': team_data.get('name', ''),
+                'team_abbreviation': team_data.get('abbreviation', ''),
+                'club_name': team_data.get('clubName', ''),
+                'location_name': team_data.get('locationName', ''),
+                
+                # League/Division
+                'league_id': league_info.get('id'),
+                'league_name': league_info.get('name'),
+                'division_id': division_info.get('id'),
+                'division_name': division_info.get('name'),
+                
+                # Season record
+                'wins': wins,
+                'losses': losses,
+                'ties': record.get('ties', 0),
+                
+                # Division standings
+                'division_rank': division_rank,
+                'games_back_division': record.get('gamesBack'),
+                'is_division_leader': division_rank == 1,
+                
+                # League record
+                'league_wins': league_record.get('wins'),
+                'league_losses': league_record.get('losses'),
+                'league_pct': league_record.get('pct')
+            }
             
-            # Update timestamp
-            team_stats.last_updated = datetime.now()
-            if not hasattr(team_stats, 'created_at') or not team_stats.created_at:
-                team_stats.created_at = datetime.now()
+            # Upsert on (team_id, season); the database stamps created_at on
+            # insert and last_updated on every write
+            bulk_upsert_rows(self.session, TeamSeasonStats, [team_row], ('team_id', 'season'))
             
             self.stats['team_season_stats_loaded'] += 1
-            logger.debug(f"Processed team season stats for {team_name}: {team_stats.wins}-{team_stats.losses}")
+            logger.debug(f"Processed team season stats for {team_row['team_name']}: {wins}-{losses}")
             
-        except Exception as e:
-            logger.error(f"Error processing {team_type} team season stats: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error processing %s team season stats", team_type)
     
     def _process_player_season_stats(self, game_data, team_type):
         """Process player season statistics from boxscore players"""
@@ -181,7 +233,7 @@ class SeasonStatsProcessor:
             team_data = teams.get(team_type, {})
             players = team_data.get('players', {})
             
-            season = 2025  # Current season
+            player_rows = []
             
             for player_key, player_data in players.items():
                 if not player_key.startswith('ID'):
@@ -205,106 +257,26 @@ class SeasonStatsProcessor:
                     is_pitcher = 'Pitcher' in primary_position
                     is_dh = primary_position == 'Designated Hitter'
                     
-                    # Check if player season stats already exist
-                    existing_stats = self.session.query(PlayerSeasonStats).filter_by(
-                        player_id=player_id, 
-                        season=season
-                    ).first()
-                    
-                    if existing_stats:
-                        # Update existing record
-                        player_stats = existing_stats
-                        logger.debug(f"Updating existing player season stats for {player_name}")
-                    else:
-                        # Create new record
-                        player_stats = PlayerSeasonStats(player_id=player_id, season=season)
-                        logger.debug(f"Creating new player season stats for {player_name}")
-                        self.session.add(player_stats)
-                    
-                    # Update player info
-                    player_stats.player_name = player_name
-                    player_stats.primary_position = primary_position
+                    player_row = {
+                        'player_id': player_id,
+                        'season': SEASON,
+                        'player_name': player_name,
+                        'primary_position': primary_position
+                    }
                     
-                    # Process stats based on player type
+                    # Process stats based on player type; a row only carries
+                    # the stat groups it has, so an upsert leaves the others
+                    # on an existing row alone
                     if is_pitcher:
                         # PITCHERS: Only load pitching stats
-                        pitching_stats = season_stats.get('pitching', {})
-                        if pitching_stats:
-                            player_stats.pitching_games_played = pitching_stats.get('gamesPlayed', 0)
-                            player_stats.games_started = pitching_stats.get('gamesStarted', 0)
-                            player_stats.complete_games = pitching_stats.get('completeGames', 0)
-                            player_stats.shutouts = pitching_stats.get('shutouts', 0)
-                            player_stats.wins = pitching_stats.get('wins', 0)
-                            player_stats.losses = pitching_stats.get('losses', 0)
-                            player_stats.saves = pitching_stats.get('saves', 0)
-                            player_stats.save_opportunities = pitching_stats.get('saveOpportunities', 0)
-                            player_stats.holds = pitching_stats.get('holds', 0)
-                            player_stats.blown_saves = pitching_stats.get('blownSaves', 0)
-                            player_stats.innings_pitched = self._clean_float(pitching_stats.get('inningsPitched', 0.0))
-                            player_stats.hits_allowed = pitching_stats.get('hits', 0)
-                            player_stats.runs_allowed = pitching_stats.get('runs', 0)
-                            player_stats.earned_runs = pitching_stats.get('earnedRuns', 0)
-                            player_stats.home_runs_allowed = pitching_stats.get('homeRuns', 0)
-                            player_stats.walks_allowed = pitching_stats.get('baseOnBalls', 0)
-                            player_stats.hit_batsmen = pitching_stats.get('hitBatsmen', 0)
-                            player_stats.pitcher_strikeouts = pitching_stats.get('strikeOuts', 0)
-                            player_stats.wild_pitches = pitching_stats.get('wildPitches', 0)
-                            player_stats.balks = pitching_stats.get('balks', 0)
-                            player_stats.era = self._clean_float(pitching_stats.get('era', 0.0))
-                            player_stats.whip = self._clean_float(pitching_stats.get('whip', 0.0))
-                            player_stats.batters_faced = pitching_stats.get('battersFaced', 0)
-                            player_stats.pitches_thrown = pitching_stats.get('pitchesThrown', 0)
-                            player_stats.strikes = pitching_stats.get('strikes', 0)
-                            player_stats.balls = pitching_stats.get('balls', 0)
-                            player_stats.strike_percentage = self._clean_float(pitching_stats.get('strikePercentage', 0.0))
-                    
+                        self._add_stats(player_row, season_stats.get('pitching', {}), PITCHING_FIELDS)
                     else:
                         # BATTERS: Load batting stats + fielding (unless DH)
-                        batting_stats = season_stats.get('batting', {})
-                        if batting_stats:
-                            player_stats.batting_games_played = batting_stats.get('gamesPlayed', 0)
-                            player_stats.at_bats = batting_stats.get('atBats', 0)
-                            player_stats.runs = batting_stats.get('runs', 0)
-                            player_stats.hits = batting_stats.get('hits', 0)
-                            player_stats.doubles = batting_stats.get('doubles', 0)
-                            player_stats.triples = batting_stats.get('triples', 0)
-                            player_stats.home_runs = batting_stats.get('homeRuns', 0)
-                            player_stats.rbi = batting_stats.get('rbi', 0)
-                            player_stats.walks = batting_stats.get('baseOnBalls', 0)
-                            player_stats.strikeouts = batting_stats.get('strikeOuts', 0)
-                            player_stats.stolen_bases = batting_stats.get('stolenBases', 0)
-                            player_stats.caught_stealing = batting_stats.get('caughtStealing', 0)
-                            player_stats.batting_avg = self._clean_float(batting_stats.get('avg', 0.0))
-                            player_stats.on_base_pct = self._clean_float(batting_stats.get('obp', 0.0))
-                            player_stats.slugging_pct = self._clean_float(batting_stats.get('slg', 0.0))
-                            player_stats.ops = self._clean_float(batting_stats.get('ops', 0.0))
-                            player_stats.plate_appearances = batting_stats.get('plateAppearances', 0)
-                            player_stats.hit_by_pitch = batting_stats.get('hitByPitch', 0)
-                            player_stats.sac_flies = batting_stats.get('sacFlies', 0)
-                            player_stats.sac_bunts = batting_stats.get('sacBunts', 0)
-                            player_stats.intentional_walks = batting_stats.get('intentionalWalks', 0)
-                            player_stats.ground_into_double_play = batting_stats.get('groundIntoDoublePlay', 0)
-                            player_stats.total_bases = batting_stats.get('totalBases', 0)
-                        
-                        # Fielding stats (skip for DH)
+                        self._add_stats(player_row, season_stats.get('batting', {}), BATTING_FIELDS)
                         if not is_dh:
-                            fielding_stats = season_stats.get('fielding', {})
-                            if fielding_stats:
-                                player_stats.fielding_games = fielding_stats.get('games', 0)
-                                player_stats.fielding_games_started = fielding_stats.get('gamesStarted', 0)
-                                player_stats.innings_fielded = self._clean_float(fielding_stats.get('innings', 0.0))
-                                player_stats.putouts = fielding_stats.get('putOuts', 0)
-                                player_stats.assists = fielding_stats.get('assists', 0)
-                                player_stats.errors = fielding_stats.get('errors', 0)
-                                player_stats.double_plays = fielding_stats.get('doublePlays', 0)
-                                player_stats.fielding_percentage = self._clean_float(fielding_stats.get('fielding', 0.0))
-                                player_stats.range_factor = self._clean_float(fielding_stats.get('rangeFactor', 0.0))
-                    
-                    # Update timestamp
-                    player_stats.last_updated = datetime.now()
-                    if not hasattr(player_stats, 'created_at') or not player_stats.created_at:
-                        player_stats.created_at = datetime.now()
+                            self._add_stats(player_row, season_stats.get('fielding', {}), FIELDING_FIELDS)
                     
+                    player_rows.append(player_row)
                     self.stats['player_season_stats_loaded'] += 1
                     
                 except ValueError:
@@ -314,12 +286,27 @@ class SeasonStatsProcessor:
                     logger.error(f"Error processing player {player_key}: {e}")
                     continue
             
+            # One executemany upsert per stat-group shape instead of a
+            # SELECT + unit-of-work flush per player
+            bulk_upsert_rows(self.session, PlayerSeasonStats, player_rows, ('player_id', 'season'))
+            
             logger.debug(f"Processed {self.stats['player_season_stats_loaded']} player season stats for {team_type} team")
             
-        except Exception as e:
-            logger.error(f"Error processing {team_type} player season stats: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error processing %s player season stats", team_type)
+    
+    def _add_stats(self, row, api_stats, fields):
+        """Copy one stat group into a season stats row"""
+        if not api_stats:
+            return
+        
+        for column, api_key, is_float in fields:
+            if column in OUTS_COLUMNS:
+                row[column] = self._innings_to_outs(api_stats.get(api_key))
+            elif is_float:
+                row[column] = self._clean_float(api_stats.get(api_key, 0.0))
+            else:
+                row[column] = api_stats.get(api_key, 0)
     
     def _clean_float(self, value):
         """Clean float values from API (handle -.-- and - strings)"""
@@ -338,6 +325,17 @@ class SeasonStatsProcessor:
         except (ValueError, TypeError):
             return None
     
+    def _innings_to_outs(self, value):
+        """Convert an innings string like '123.1' to outs (370)"""
+        if value is None:
+            return None
+        
+        whole, _, thirds = str(value).partition('.')
+        try:
+            return int(whole or 0) * 3 + int(thirds or 0)
+        except ValueError:
+            return None
+    
     def get_stats(self):
         """Return processing statistics"""
         return self.stats.copy()
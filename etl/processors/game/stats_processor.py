@@ -1,12 +1,23 @@
 #!/usr/bin/env python3
 
 import logging
-from datetime import datetime
+from functools import lru_cache
 
 from models import BoxScore, GameWPA, get_session
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _parse_inning(inning_str):
+    """Parse a WPA inning code like 'T1' / 'B9' into (inning, inning_half)"""
+    if len(inning_str) >= 2:
+        inning_half = 'top' if inning_str[0] == 'T' else 'bottom'
+        try:
+            return int(inning_str[1:]), inning_half
+        except ValueError:
+            return 1, inning_half
+    return 1, 'top'
+
 class StatsProcessor:
     """Handles box score and WPA statistics processing"""
     
@@ -32,10 +43,8 @@ class StatsProcessor:
             
             return True
             
-        except Exception as e:
-            logger.error(f"Error processing stats data: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error processing stats data")
             return False
     
     def _load_box_score_data(self, game_data, game_pk):
@@ -45,6 +54,12 @@ class StatsProcessor:
             boxscore = game_data.get('boxscore', {})
             teams = boxscore.get('teams', {})
             
+            # Fetch the players already loaded for this game in one query
+            existing_ids = {
+                player_id for (player_id,) in self.session.query(BoxScore.player_id).filter_by(game_pk=game_pk)
+            }
+            new_rows = []
+            
             for team_type in ['home', 'away']:
                 team_data = teams.get(team_type, {})
                 players = team_data.get('players', {})
@@ -68,39 +83,35 @@ class StatsProcessor:
                     position_info = player_data.get('position', {})
                     position = position_info.get('name', 'Unknown')
                     
-                    existing_box = self.session.query(BoxScore).filter_by(
-                        game_pk=game_pk, 
-                        player_id=player_id
-                    ).first()
-                    
-                    if existing_box:
+                    if player_id in existing_ids:
                         continue
+                    existing_ids.add(player_id)
                     
-                    box_score = BoxScore(
-                        game_pk=game_pk,
-                        player_id=player_id,
-                        team_type=team_type,
-                        player_name=player_name,
-                        position=position,
-                        at_bats=batting_stats.get('atBats', 0),
-                        runs=batting_stats.get('runs', 0),
-                        hits=batting_stats.get('hits', 0),
-                        rbi=batting_stats.get('rbi', 0),
-                        walks=batting_stats.get('baseOnBalls', 0),
-                        strikeouts=batting_stats.get('strikeOuts', 0),
-                        created_at=datetime.now()
-                    )
-                    
-                    self.session.add(box_score)
+                    new_rows.append({
+                        'game_pk': game_pk,
+                        'player_id': player_id,
+                        'team_type': team_type,
+                        'player_name': player_name,
+                        'position': position,
+                        'at_bats': batting_stats.get('atBats', 0),
+                        'runs': batting_stats.get('runs', 0),
+                        'hits': batting_stats.get('hits', 0),
+                        'rbi': batting_stats.get('rbi', 0),
+                        'walks': batting_stats.get('baseOnBalls', 0),
+                        'strikeouts': batting_stats.get('strikeOuts', 0)
+                    })
                     self.stats['box_scores_loaded'] += 1
             
-            logger.debug(f"Loaded {self.stats['box_scores_loaded']} box score records from API boxscore data")
+            # One multi-row INSERT (insertmanyvalues) instead of a unit-of-work
+            # entry per player
+            if new_rows:
+                self.session.execute(BoxScore.__table__.insert(), new_rows)
+            
+            logger.debug("Loaded %d box score records from API boxscore data", self.stats['box_scores_loaded'])
             return True
             
-        except Exception as e:
-            logger.error(f"Error loading box scores: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error loading box scores")
             return False
     
     def _load_wpa_data(self, game_data, game_pk):
@@ -111,48 +122,43 @@ class StatsProcessor:
             wpa_data = stats.get('wpa', {})
             game_wpa = wpa_data.get('gameWpa', [])
             
-            logger.debug(f"Processing {len(game_wpa)} WPA records")
+            logger.debug("Processing %d WPA records", len(game_wpa))
             
+            wpa_rows = []
             for wpa_record in game_wpa:
                 if not isinstance(wpa_record, dict):
                     continue
                 
-                # Extract inning info
-                inning_str = wpa_record.get('i', '')
-                if len(inning_str) >= 2:
-                    inning_half = 'top' if inning_str[0] == 'T' else 'bottom'
-                    try:
-                        inning = int(inning_str[1:])
-                    except ValueError:
-                        inning = 1
-                else:
-                    inning_half = 'top'
-                    inning = 1
+                # Extract inning info; only a couple dozen distinct codes per
+                # game, so the parse is cached
+                inning, inning_half = _parse_inning(wpa_record.get('i', ''))
                 
                 at_bat_index = wpa_record.get('atBatIndex', 0)
-                play_id = f"{game_pk}_wpa_{at_bat_index}"
+                play_id = game_pk * 1000 + at_bat_index
                 
-                wpa = GameWPA(
-                    play_id=play_id,
-                    game_pk=game_pk,
-                    inning=inning,
-                    inning_half=inning_half,
-                    home_win_exp=wpa_record.get('homeTeamWinProbability', 0.0) / 100.0,
-                    away_win_exp=wpa_record.get('awayTeamWinProbability', 0.0) / 100.0,
-                    win_exp_added=wpa_record.get('homeTeamWinProbabilityAdded', 0.0) / 100.0,
-                    batter_id=None,
-                    pitcher_id=None,
-                    created_at=datetime.now()
-                )
-                
-                self.session.add(wpa)
+                wpa_rows.append({
+                    'play_id': play_id,
+                    'game_pk': game_pk,
+                    'inning': inning,
+                    'inning_half': inning_half,
+                    'home_win_exp': wpa_record.get('homeTeamWinProbability', 0.0) / 100.0,
+                    'away_win_exp': wpa_record.get('awayTeamWinProbability', 0.0) / 100.0,
+                    'win_exp_added': wpa_record.get('homeTeamWinProbabilityAdded', 0.0) / 100.0,
+                    'batter_id': None,
+                    'pitcher_id': None
+                })
                 self.stats['wpa_loaded'] += 1
             
-            logger.debug(f"Loaded {self.stats['wpa_loaded']} WPA records")
+            # One executemany instead of a unit-of-work entry per play; the
+            # orchestrator clears the game's WPA rows beforehand
+            if wpa_rows:
+                self.session.execute(GameWPA.__table__.insert(), wpa_rows)
+            
+            logger.debug("Loaded %d WPA records", self.stats['wpa_loaded'])
             return True
             
         except Exception as e:
-            logger.error(f"Error loading WPA data: {e}")
+            logger.error("Error loading WPA data: %s", e)
             return False
     
     def get_stats(self):
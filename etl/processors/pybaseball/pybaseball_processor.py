@@ -1,6 +1,19 @@
 #!/usr/bin/env python3
+"""
+Pybaseball Statcast Processor
+Truncates and reloads the batter/pitcher Statcast leaderboard tables
 
+Loads run with synchronous_commit off, so a crash can lose the last few
+commits. That is acceptable here: every load is a full reset, and
+rerunning the loader rebuilds the tables.
+"""
+
+import io
 import logging
+import threading
+import concurrent.futures
+from functools import cached_property
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
@@ -10,391 +23,310 @@ from models import (
     get_session, Player, BatterExitVelocityBarrels, BatterExpectedStats,
     BatterPercentileRanks, BatterPitchArsenal, PitcherExitVelocityBarrels, 
     PitcherExpectedStats, PitcherPercentileRanks, PitcherArsenalStats, 
-    PitcherPitchArsenalUsage
+    PitcherPitchUsage, ARSENAL_USAGE_PITCH_TYPES
 )
 
 logger = logging.getLogger(__name__)
 
+# Loads never read ORM objects back, so skip autoflush and post-commit expiry
+SESSION_OPTIONS = {'autoflush': False, 'expire_on_commit': False}
+
+# Per-table load spec. Columns are named as they land in the model; 'renames'
+# maps pybaseball's source column names onto them
+_EXIT_VELOCITY_SCHEMA = {
+    'int_cols': ['attempts', 'ev95plus', 'max_distance', 'avg_distance', 'avg_hr_distance',
+                 'barrels'],
+    'float_cols': ['avg_hit_angle', 'anglesweetspotpercent', 'max_hit_speed', 'avg_hit_speed',
+                   'ev50', 'ev95percent', 'fbld', 'gb', 'brl_percent', 'brl_pa'],
+    'str_cols': ['player_name']
+}
+
+_EXPECTED_STATS_FLOAT_COLS = ['ba', 'est_ba', 'est_ba_minus_ba_diff', 'slg', 'est_slg',
+                              'est_slg_minus_slg_diff', 'woba', 'est_woba',
+                              'est_woba_minus_woba_diff']
+
+_ARSENAL_SCHEMA = {
+    'int_cols': ['pitches', 'pa'],
+    'float_cols': ['pitch_usage', 'ba', 'slg', 'woba', 'est_ba', 'est_slg', 'est_woba',
+                   'run_value_per_100', 'run_value', 'whiff_percent', 'k_percent', 'put_away',
+                   'hard_hit_percent'],
+    'str_cols': ['pitch_type', 'player_name', 'team_name_alt', 'pitch_name']
+}
+
+SCHEMAS = {
+    BatterExitVelocityBarrels: _EXIT_VELOCITY_SCHEMA,
+    BatterExpectedStats: {
+        'int_cols': ['pa', 'bip'],
+        'float_cols': _EXPECTED_STATS_FLOAT_COLS,
+        'str_cols': ['player_name']
+    },
+    BatterPercentileRanks: {
+        'renames': {'exit_velocity_avg': 'exit_velocity'},
+        'int_cols': [],
+        'float_cols': ['xwoba', 'xba', 'xslg', 'xiso', 'xobp', 'brl', 'brl_percent',
+                       'exit_velocity', 'max_ev', 'hard_hit_percent', 'k_percent', 'bb_percent',
+                       'whiff_percent', 'chase_percent', 'arm_strength', 'sprint_speed', 'oaa',
+                       'bat_speed', 'squared_up_rate', 'swing_length'],
+        'str_cols': ['player_name']
+    },
+    BatterPitchArsenal: _ARSENAL_SCHEMA,
+    PitcherExitVelocityBarrels: _EXIT_VELOCITY_SCHEMA,
+    PitcherExpectedStats: {
+        'int_cols': ['pa', 'bip'],
+        'float_cols': _EXPECTED_STATS_FLOAT_COLS + ['era', 'xera', 'era_minus_xera_diff'],
+        'str_cols': ['player_name']
+    },
+    PitcherPercentileRanks: {
+        'renames': {'exit_velocity_avg': 'exit_velocity'},
+        'int_cols': [],
+        'float_cols': ['xwoba', 'xba', 'xslg', 'xiso', 'xobp', 'xera', 'brl', 'brl_percent',
+                       'exit_velocity', 'max_ev', 'hard_hit_percent', 'k_percent', 'bb_percent',
+                       'whiff_percent', 'chase_percent', 'arm_strength', 'fb_velocity',
+                       'fb_spin', 'curve_spin'],
+        'str_cols': ['player_name']
+    },
+    PitcherArsenalStats: _ARSENAL_SCHEMA,
+    PitcherPitchUsage: {
+        # Note: uses 'pitcher' column not 'player_id'
+        'source_id_col': 'pitcher',
+        'renames': {'last_name, first_name': 'player_name'},
+        'int_cols': [],
+        'float_cols': list(ARSENAL_USAGE_PITCH_TYPES),
+        'str_cols': ['player_name'],
+        # One n_* column per pitch type, melted to a row per pitch type
+        'melt': ARSENAL_USAGE_PITCH_TYPES
+    }
+}
+
+# (model, key in the client's data dict) in load order
+BATTER_TABLES = [
+    (BatterExitVelocityBarrels, 'exit_velocity'),
+    (BatterExpectedStats, 'expected_stats'),
+    (BatterPercentileRanks, 'percentile_ranks'),
+    (BatterPitchArsenal, 'pitch_arsenal')
+]
+
+PITCHER_TABLES = [
+    (PitcherExitVelocityBarrels, 'exit_velocity'),
+    (PitcherExpectedStats, 'expected_stats'),
+    (PitcherPercentileRanks, 'percentile_ranks'),
+    (PitcherArsenalStats, 'arsenal_stats'),
+    (PitcherPitchUsage, 'pitch_arsenal_usage')
+]
+
 class PybaseballProcessor:
     
-    def __init__(self):
-        self.session = get_session()
+    def __init__(self, max_workers=4):
+        self.session = get_session(**SESSION_OPTIONS)
+        self.max_workers = max_workers
         self.stats = {
             'batters_processed': 0,
             'pitchers_processed': 0,
             'total_records': 0
         }
+        # The loader runs the batter and pitcher phases on separate threads
+        self._stats_lock = threading.Lock()
+        self.index_defs = self._get_index_definitions()
     
-    def get_player_classifications(self):
+    def _get_index_definitions(self):
 
-        # Get player mapping and positions 
+        # Capture secondary index DDL once so each load can drop and rebuild
+        # it; constraint-backed indexes (PK/unique) stay in place
         result = self.session.execute(text("""
-            SELECT mlb_id, full_name, primary_position_name
+            SELECT tablename, indexname, indexdef
+            FROM pg_indexes
+            WHERE schemaname = current_schema()
+              AND tablename = ANY(:tables)
+              AND indexname NOT IN (SELECT conname FROM pg_constraint)
+        """), {'tables': [model.__tablename__ for model in SCHEMAS]})
+        
+        index_defs = {}
+        for table_name, index_name, index_def in result:
+            index_defs.setdefault(table_name, []).append((index_name, index_def))
+        
+        return index_defs
+    
+    def _drop_indexes(self, session, table_name):
+
+        for index_name, _ in self.index_defs.get(table_name, []):
+            session.execute(text(f'DROP INDEX IF EXISTS "{index_name}"'))
+    
+    def _recreate_indexes(self, session, table_name, defs):
+
+        for _, index_def in defs:
+            session.execute(text(index_def))
+    
+    @cached_property
+    def player_classifications(self):
+
+        # Split active players server-side into pitcher / batter id arrays:
+        # Pitcher (R) / Pitcher (L) vs Batter (R), Batter (L), or NULL
+        pitchers, batters = self.session.execute(text("""
+            SELECT
+                COALESCE(array_agg(mlb_id) FILTER (WHERE primary_position_name LIKE '%Pitcher%'), '{}'),
+                COALESCE(array_agg(mlb_id) FILTER (WHERE primary_position_name IS NULL
+                                                      OR primary_position_name NOT LIKE '%Pitcher%'), '{}')
             FROM players 
             WHERE active = true
-        """))
+        """)).one()
         
-        batters = set()
-        pitchers = set()
+        # int64 pd.Index keeps its hash table around for the repeated isin()
+        # filters (an empty list would otherwise give an object Index)
+        return pd.Index(batters, dtype='int64'), pd.Index(pitchers, dtype='int64')
+    
+    def _select_columns(self, data, columns):
+
+        # Add any columns missing from this pull once up front so every
+        # record carries the full column set
+        missing = [col for col in columns if col not in data.columns]
+        if missing:
+            data = data.assign(**{col: None for col in missing})
         
-        for mlb_id, name, position_name in result:
-            if position_name and 'Pitcher' in position_name:  # Pitcher (R) or Pitcher (L)
-                pitchers.add(mlb_id)
-            else:  # Batter (R), Batter (L), or NULL
-                batters.add(mlb_id)
+        return data[columns]
+    
+    def _coerce_types(self, data, int_columns, float_columns):
+
+        # Cast whole columns to nullable dtypes once instead of per-row
+        # int()/float() calls
+        data = data.copy()
+        data[int_columns] = np.trunc(data[int_columns].astype('Float64')).astype('Int64')
+        data[float_columns] = data[float_columns].astype('Float64')
         
-        return batters, pitchers
+        return data
     
-    def process_batter_data(self, batter_data, batters):
+    def process_batter_data(self, batter_data, batters=None):
+        
+        if batters is None:
+            batters = self.player_classifications[0]
         
         try:
-            self.load_batter_exit_velocity_barrels(batter_data['exit_velocity'], batters)
-            self.load_batter_expected_stats(batter_data['expected_stats'], batters)
-            self.load_batter_percentile_ranks(batter_data['percentile_ranks'], batters)
-            self.load_batter_pitch_arsenal(batter_data['pitch_arsenal'], batters)
-            
-            self.session.commit()
+            count = self._load_tables(BATTER_TABLES, batter_data, batters)
+            with self._stats_lock:
+                self.stats['batters_processed'] += count
+            return count
             
         except Exception as e:
-            self.session.rollback()
             logger.error(f"Error processing batter data: {e}")
             raise
     
-    def process_pitcher_data(self, pitcher_data, pitchers):
+    def process_pitcher_data(self, pitcher_data, pitchers=None):
+        
+        if pitchers is None:
+            pitchers = self.player_classifications[1]
         
         try:
-            self.load_pitcher_exit_velocity_barrels(pitcher_data['exit_velocity'], pitchers)
-            self.load_pitcher_expected_stats(pitcher_data['expected_stats'], pitchers)
-            self.load_pitcher_percentile_ranks(pitcher_data['percentile_ranks'], pitchers)
-            self.load_pitcher_arsenal_stats(pitcher_data['arsenal_stats'], pitchers)
-            self.load_pitcher_pitch_arsenal_usage(pitcher_data['pitch_arsenal_usage'], pitchers)
-            
-            self.session.commit()
+            count = self._load_tables(PITCHER_TABLES, pitcher_data, pitchers)
+            with self._stats_lock:
+                self.stats['pitchers_processed'] += count
+            return count
             
         except Exception as e:
-            self.session.rollback()
             logger.error(f"Error processing pitcher data: {e}")
             raise
     
-    def load_batter_exit_velocity_barrels(self, data, batters):
+    def _load_tables(self, tables, data, ids):
 
-        # Clear existing data
-        self.session.query(BatterExitVelocityBarrels).delete()
-        
-        clean_data = data[data['player_id'].isin(batters)]
-        
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = BatterExitVelocityBarrels(
-                player_id=int(row['player_id']),
-                year=2025,
-                player_name=row.get('player_name'),
-                attempts=None if pd.isna(row.get('attempts')) else int(row.get('attempts')),
-                avg_hit_angle=None if pd.isna(row.get('avg_hit_angle')) else float(row.get('avg_hit_angle')),
-                anglesweetspotpercent=None if pd.isna(row.get('anglesweetspotpercent')) else float(row.get('anglesweetspotpercent')),
-                max_hit_speed=None if pd.isna(row.get('max_hit_speed')) else float(row.get('max_hit_speed')),
-                avg_hit_speed=None if pd.isna(row.get('avg_hit_speed')) else float(row.get('avg_hit_speed')),
-                ev50=None if pd.isna(row.get('ev50')) else float(row.get('ev50')),
-                ev95plus=None if pd.isna(row.get('ev95plus')) else int(row.get('ev95plus')),
-                ev95percent=None if pd.isna(row.get('ev95percent')) else float(row.get('ev95percent')),
-                max_distance=None if pd.isna(row.get('max_distance')) else int(row.get('max_distance')),
-                avg_distance=None if pd.isna(row.get('avg_distance')) else int(row.get('avg_distance')),
-                avg_hr_distance=None if pd.isna(row.get('avg_hr_distance')) else int(row.get('avg_hr_distance')),
-                fbld=None if pd.isna(row.get('fbld')) else float(row.get('fbld')),
-                gb=None if pd.isna(row.get('gb')) else float(row.get('gb')),
-                barrels=None if pd.isna(row.get('barrels')) else int(row.get('barrels')),
-                brl_percent=None if pd.isna(row.get('brl_percent')) else float(row.get('brl_percent')),
-                brl_pa=None if pd.isna(row.get('brl_pa')) else float(row.get('brl_pa'))
-            )
-            self.session.add(record)
-            inserted += 1
-        
-        self.stats['batters_processed'] += inserted
-    
-    def load_batter_expected_stats(self, data, batters):
-
-        # Clear existing data
-        self.session.query(BatterExpectedStats).delete()
-        
-        clean_data = data[data['player_id'].isin(batters)]
-        
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = BatterExpectedStats(
-                player_id=int(row['player_id']),
-                year=2025,
-                player_name=row.get('player_name'),
-                pa=None if pd.isna(row.get('pa')) else int(row.get('pa')),
-                bip=None if pd.isna(row.get('bip')) else int(row.get('bip')),
-                ba=None if pd.isna(row.get('ba')) else float(row.get('ba')),
-                est_ba=None if pd.isna(row.get('est_ba')) else float(row.get('est_ba')),
-                est_ba_minus_ba_diff=None if pd.isna(row.get('est_ba_minus_ba_diff')) else float(row.get('est_ba_minus_ba_diff')),
-                slg=None if pd.isna(row.get('slg')) else float(row.get('slg')),
-                est_slg=None if pd.isna(row.get('est_slg')) else float(row.get('est_slg')),
-                est_slg_minus_slg_diff=None if pd.isna(row.get('est_slg_minus_slg_diff')) else float(row.get('est_slg_minus_slg_diff')),
-                woba=None if pd.isna(row.get('woba')) else float(row.get('woba')),
-                est_woba=None if pd.isna(row.get('est_woba')) else float(row.get('est_woba')),
-                est_woba_minus_woba_diff=None if pd.isna(row.get('est_woba_minus_woba_diff')) else float(row.get('est_woba_minus_woba_diff'))
-            )
-            self.session.add(record)
-            inserted += 1
-        
-        self.stats['batters_processed'] += inserted
-    
-    def load_batter_percentile_ranks(self, data, batters):
-
-        # Clear existing data
-        self.session.query(BatterPercentileRanks).delete()
-        
-        clean_data = data[data['player_id'].isin(batters)]
-        
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = BatterPercentileRanks(
-                player_id=int(row['player_id']),
-                year=2025,
-                player_name=row.get('player_name'),
-                xwoba=None if pd.isna(row.get('xwoba')) else float(row.get('xwoba')),
-                xba=None if pd.isna(row.get('xba')) else float(row.get('xba')),
-                xslg=None if pd.isna(row.get('xslg')) else float(row.get('xslg')),
-                xiso=None if pd.isna(row.get('xiso')) else float(row.get('xiso')),
-                xobp=None if pd.isna(row.get('xobp')) else float(row.get('xobp')),
-                brl=None if pd.isna(row.get('brl')) else float(row.get('brl')),
-                brl_percent=None if pd.isna(row.get('brl_percent')) else float(row.get('brl_percent')),
-                exit_velocity=None if pd.isna(row.get('exit_velocity_avg')) else float(row.get('exit_velocity_avg')),
-                max_ev=None if pd.isna(row.get('max_ev')) else float(row.get('max_ev')),
-                hard_hit_percent=None if pd.isna(row.get('hard_hit_percent')) else float(row.get('hard_hit_percent')),
-                k_percent=None if pd.isna(row.get('k_percent')) else float(row.get('k_percent')),
-                bb_percent=None if pd.isna(row.get('bb_percent')) else float(row.get('bb_percent')),
-                whiff_percent=None if pd.isna(row.get('whiff_percent')) else float(row.get('whiff_percent')),
-                chase_percent=None if pd.isna(row.get('chase_percent')) else float(row.get('chase_percent')),
-                arm_strength=None if pd.isna(row.get('arm_strength')) else float(row.get('arm_strength')),
-                sprint_speed=None if pd.isna(row.get('sprint_speed')) else float(row.get('sprint_speed')),
-                oaa=None if pd.isna(row.get('oaa')) else float(row.get('oaa')),
-                bat_speed=None if pd.isna(row.get('bat_speed')) else float(row.get('bat_speed')),
-                squared_up_rate=None if pd.isna(row.get('squared_up_rate')) else float(row.get('squared_up_rate')),
-                swing_length=None if pd.isna(row.get('swing_length')) else float(row.get('swing_length'))
-            )
-            self.session.add(record)
-            inserted += 1
-        
-        self.stats['batters_processed'] += inserted
-    
-    def load_batter_pitch_arsenal(self, data, batters):
-
-        # Clear existing data
-        self.session.query(BatterPitchArsenal).delete()
-        
-        clean_data = data[data['player_id'].isin(batters)]
-        
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = BatterPitchArsenal(
-                player_id=int(row['player_id']),
-                year=2025,
-                pitch_type=row.get('pitch_type'),
-                player_name=row.get('player_name'),
-                team_name_alt=row.get('team_name_alt'),
-                pitch_name=row.get('pitch_name'),
-                pitches=None if pd.isna(row.get('pitches')) else int(row.get('pitches')),
-                pitch_usage=None if pd.isna(row.get('pitch_usage')) else float(row.get('pitch_usage')),
-                pa=None if pd.isna(row.get('pa')) else int(row.get('pa')),
-                ba=None if pd.isna(row.get('ba')) else float(row.get('ba')),
-                slg=None if pd.isna(row.get('slg')) else float(row.get('slg')),
-                woba=None if pd.isna(row.get('woba')) else float(row.get('woba')),
-                est_ba=None if pd.isna(row.get('est_ba')) else float(row.get('est_ba')),
-                est_slg=None if pd.isna(row.get('est_slg')) else float(row.get('est_slg')),
-                est_woba=None if pd.isna(row.get('est_woba')) else float(row.get('est_woba')),
-                run_value_per_100=None if pd.isna(row.get('run_value_per_100')) else float(row.get('run_value_per_100')),
-                run_value=None if pd.isna(row.get('run_value')) else float(row.get('run_value')),
-                whiff_percent=None if pd.isna(row.get('whiff_percent')) else float(row.get('whiff_percent')),
-                k_percent=None if pd.isna(row.get('k_percent')) else float(row.get('k_percent')),
-                put_away=None if pd.isna(row.get('put_away')) else float(row.get('put_away')),
-                hard_hit_percent=None if pd.isna(row.get('hard_hit_percent')) else float(row.get('hard_hit_percent'))
-            )
-            self.session.add(record)
-            inserted += 1
-        
-        self.stats['batters_processed'] += inserted
-    
-    # PITCHER METHODS - EXACT copy from working file using ORM
-    
-    def load_pitcher_exit_velocity_barrels(self, data, pitchers):
-
-        # Clear existing data
-        self.session.query(PitcherExitVelocityBarrels).delete()
-        
-        clean_data = data[data['player_id'].isin(pitchers)]
-        
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = PitcherExitVelocityBarrels(
-                player_id=int(row['player_id']),
-                year=2025,
-                player_name=row.get('player_name'),
-                attempts=None if pd.isna(row.get('attempts')) else int(row.get('attempts')),
-                avg_hit_angle=None if pd.isna(row.get('avg_hit_angle')) else float(row.get('avg_hit_angle')),
-                anglesweetspotpercent=None if pd.isna(row.get('anglesweetspotpercent')) else float(row.get('anglesweetspotpercent')),
-                max_hit_speed=None if pd.isna(row.get('max_hit_speed')) else float(row.get('max_hit_speed')),
-                avg_hit_speed=None if pd.isna(row.get('avg_hit_speed')) else float(row.get('avg_hit_speed')),
-                ev50=None if pd.isna(row.get('ev50')) else float(row.get('ev50')),
-                ev95plus=None if pd.isna(row.get('ev95plus')) else int(row.get('ev95plus')),
-                ev95percent=None if pd.isna(row.get('ev95percent')) else float(row.get('ev95percent')),
-                max_distance=None if pd.isna(row.get('max_distance')) else int(row.get('max_distance')),
-                avg_distance=None if pd.isna(row.get('avg_distance')) else int(row.get('avg_distance')),
-                avg_hr_distance=None if pd.isna(row.get('avg_hr_distance')) else int(row.get('avg_hr_distance')),
-                fbld=None if pd.isna(row.get('fbld')) else float(row.get('fbld')),
-                gb=None if pd.isna(row.get('gb')) else float(row.get('gb')),
-                barrels=None if pd.isna(row.get('barrels')) else int(row.get('barrels')),
-                brl_percent=None if pd.isna(row.get('brl_percent')) else float(row.get('brl_percent')),
-                brl_pa=None if pd.isna(row.get('brl_pa')) else float(row.get('brl_pa'))
-            )
-            self.session.add(record)
-            inserted += 1
-        
-        self.stats['pitchers_processed'] += inserted
+        # Clean and render every table's CSV on worker threads while the
+        # connection streams finished ones through COPY, then commit once
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (model, executor.submit(self._prepare, model, data[key], ids))
+                for model, key in tables
+            ]
+            
+            session = get_session(**SESSION_OPTIONS)
+            try:
+                # Full-table reload is rerunnable, so skip the commit's WAL flush
+                session.execute(text("SET LOCAL synchronous_commit = OFF"))
+                cursor = session.connection().connection.cursor()
+                
+                # Clear the whole phase in one metadata-only TRUNCATE rather than
+                # a row-by-row DELETE per table
+                table_list = ', '.join(f'"{model.__tablename__}"' for model, _ in tables)
+                session.execute(text(f'TRUNCATE TABLE {table_list} RESTART IDENTITY'))
+                
+                count = 0
+                for model, future in futures:
+                    count += self._load(session, cursor, model, *future.result())
+                
+                session.commit()
+                return count
+            except Exception:
+                session.rollback()
+                for _, future in futures:
+                    future.cancel()
+                raise
+            finally:
+                session.close()
     
-    def load_pitcher_expected_stats(self, data, pitchers):
+    def _prepare(self, model, data, ids):
 
-        # Clear existing data
-        self.session.query(PitcherExpectedStats).delete()
-        
-        clean_data = data[data['player_id'].isin(pitchers)]
-        
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = PitcherExpectedStats(
-                player_id=int(row['player_id']),
-                year=2025,
-                player_name=row.get('player_name'),
-                pa=None if pd.isna(row.get('pa')) else int(row.get('pa')),
-                bip=None if pd.isna(row.get('bip')) else int(row.get('bip')),
-                ba=None if pd.isna(row.get('ba')) else float(row.get('ba')),
-                est_ba=None if pd.isna(row.get('est_ba')) else float(row.get('est_ba')),
-                est_ba_minus_ba_diff=None if pd.isna(row.get('est_ba_minus_ba_diff')) else float(row.get('est_ba_minus_ba_diff')),
-                slg=None if pd.isna(row.get('slg')) else float(row.get('slg')),
-                est_slg=None if pd.isna(row.get('est_slg')) else float(row.get('est_slg')),
-                est_slg_minus_slg_diff=None if pd.isna(row.get('est_slg_minus_slg_diff')) else float(row.get('est_slg_minus_slg_diff')),
-                woba=None if pd.isna(row.get('woba')) else float(row.get('woba')),
-                est_woba=None if pd.isna(row.get('est_woba')) else float(row.get('est_woba')),
-                est_woba_minus_woba_diff=None if pd.isna(row.get('est_woba_minus_woba_diff')) else float(row.get('est_woba_minus_woba_diff')),
-                era=None if pd.isna(row.get('era')) else float(row.get('era')),
-                xera=None if pd.isna(row.get('xera')) else float(row.get('xera')),
-                era_minus_xera_diff=None if pd.isna(row.get('era_minus_xera_diff')) else float(row.get('era_minus_xera_diff'))
-            )
-            self.session.add(record)
-            inserted += 1
-        
-        self.stats['pitchers_processed'] += inserted
+        schema = SCHEMAS[model]
+        int_columns = ['player_id'] + schema['int_cols']
+        columns = int_columns + schema['float_cols'] + schema['str_cols']
+        
+        # A failed or empty pull may not even carry the id column
+        if data.empty:
+            return columns, None, 0
+        
+        id_col = schema.get('source_id_col', 'player_id')
+        # Numeric ids keep isin() on the hashtable path even when pybaseball
+        # hands back an object column
+        clean_data = data[pd.to_numeric(data[id_col], errors='coerce').isin(ids)]
+        renames = {src: dst for src, dst in schema.get('renames', {}).items()
+                   if src in clean_data.columns}
+        clean_data = clean_data.drop(columns=[dst for dst in renames.values()
+                                              if dst in clean_data.columns])
+        clean_data = clean_data.rename(columns=renames)
+        clean_data = clean_data.assign(player_id=clean_data[id_col])
+        clean_data = self._select_columns(clean_data, columns)
+        clean_data = self._coerce_types(clean_data, int_columns, schema['float_cols'])
+        if 'melt' in schema:
+            clean_data = self._melt_columns(clean_data, schema['melt'], ['player_id'] + schema['str_cols'])
+        clean_data['year'] = 2025
+        
+        buffer = io.StringIO()
+        clean_data.to_csv(buffer, index=False, header=False, na_rep='\\N')
+        buffer.seek(0)
+        
+        return list(clean_data.columns), buffer, len(clean_data)
     
-    def load_pitcher_percentile_ranks(self, data, pitchers):
+    def _melt_columns(self, data, pitch_types, id_columns):
 
-        # Clear existing data
-        self.session.query(PitcherPercentileRanks).delete()
-        
-        clean_data = data[data['player_id'].isin(pitchers)]
-        
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = PitcherPercentileRanks(
-                player_id=int(row['player_id']),
-                year=2025,
-                player_name=row.get('player_name'),
-                xwoba=None if pd.isna(row.get('xwoba')) else float(row.get('xwoba')),
-                xba=None if pd.isna(row.get('xba')) else float(row.get('xba')),
-                xslg=None if pd.isna(row.get('xslg')) else float(row.get('xslg')),
-                xiso=None if pd.isna(row.get('xiso')) else float(row.get('xiso')),
-                xobp=None if pd.isna(row.get('xobp')) else float(row.get('xobp')),
-                xera=None if pd.isna(row.get('xera')) else float(row.get('xera')),
-                brl=None if pd.isna(row.get('brl')) else float(row.get('brl')),
-                brl_percent=None if pd.isna(row.get('brl_percent')) else float(row.get('brl_percent')),
-                exit_velocity=None if pd.isna(row.get('exit_velocity_avg')) else float(row.get('exit_velocity_avg')),
-                max_ev=None if pd.isna(row.get('max_ev')) else float(row.get('max_ev')),
-                hard_hit_percent=None if pd.isna(row.get('hard_hit_percent')) else float(row.get('hard_hit_percent')),
-                k_percent=None if pd.isna(row.get('k_percent')) else float(row.get('k_percent')),
-                bb_percent=None if pd.isna(row.get('bb_percent')) else float(row.get('bb_percent')),
-                whiff_percent=None if pd.isna(row.get('whiff_percent')) else float(row.get('whiff_percent')),
-                chase_percent=None if pd.isna(row.get('chase_percent')) else float(row.get('chase_percent')),
-                arm_strength=None if pd.isna(row.get('arm_strength')) else float(row.get('arm_strength')),
-                fb_velocity=None if pd.isna(row.get('fb_velocity')) else float(row.get('fb_velocity')),
-                fb_spin=None if pd.isna(row.get('fb_spin')) else float(row.get('fb_spin')),
-                curve_spin=None if pd.isna(row.get('curve_spin')) else float(row.get('curve_spin'))
-            )
-            self.session.add(record)
-            inserted += 1
-        
-        self.stats['pitchers_processed'] += inserted
+        # Wide per-pitch-type columns -> (pitch_type, pitch_usage) rows,
+        # dropping the pitch types a pitcher doesn't throw
+        data = data.melt(id_vars=id_columns, value_vars=list(pitch_types),
+                         var_name='pitch_type', value_name='pitch_usage')
+        data = data.dropna(subset=['pitch_usage'])
+        data['pitch_type'] = data['pitch_type'].map(pitch_types)
+        
+        return data
     
-    def load_pitcher_arsenal_stats(self, data, pitchers):
+    def _load(self, session, cursor, model, columns, buffer, count):
 
-        # Clear existing data
-        self.session.query(PitcherArsenalStats).delete()
-        
-        clean_data = data[data['player_id'].isin(pitchers)]
+        if not count:
+            logger.info(f"No {model.__tablename__} rows to load; skipping")
+            return 0
         
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = PitcherArsenalStats(
-                player_id=int(row['player_id']),
-                year=2025,
-                pitch_type=row.get('pitch_type'),
-                player_name=row.get('player_name'),
-                team_name_alt=row.get('team_name_alt'),
-                pitch_name=row.get('pitch_name'),
-                pitches=None if pd.isna(row.get('pitches')) else int(row.get('pitches')),
-                pitch_usage=None if pd.isna(row.get('pitch_usage')) else float(row.get('pitch_usage')),
-                pa=None if pd.isna(row.get('pa')) else int(row.get('pa')),
-                ba=None if pd.isna(row.get('ba')) else float(row.get('ba')),
-                slg=None if pd.isna(row.get('slg')) else float(row.get('slg')),
-                woba=None if pd.isna(row.get('woba')) else float(row.get('woba')),
-                est_ba=None if pd.isna(row.get('est_ba')) else float(row.get('est_ba')),
-                est_slg=None if pd.isna(row.get('est_slg')) else float(row.get('est_slg')),
-                est_woba=None if pd.isna(row.get('est_woba')) else float(row.get('est_woba')),
-                run_value_per_100=None if pd.isna(row.get('run_value_per_100')) else float(row.get('run_value_per_100')),
-                run_value=None if pd.isna(row.get('run_value')) else float(row.get('run_value')),
-                whiff_percent=None if pd.isna(row.get('whiff_percent')) else float(row.get('whiff_percent')),
-                k_percent=None if pd.isna(row.get('k_percent')) else float(row.get('k_percent')),
-                put_away=None if pd.isna(row.get('put_away')) else float(row.get('put_away')),
-                hard_hit_percent=None if pd.isna(row.get('hard_hit_percent')) else float(row.get('hard_hit_percent'))
-            )
-            self.session.add(record)
-            inserted += 1
-        
-        self.stats['pitchers_processed'] += inserted
-    
-    def load_pitcher_pitch_arsenal_usage(self, data, pitchers):
-
-        # Clear existing data
-        self.session.query(PitcherPitchArsenalUsage).delete()
+        self._drop_indexes(session, model.__tablename__)
         
-        # Note: uses 'pitcher' column not 'player_id' - EXACT from working file
-        clean_data = data[data['pitcher'].isin(pitchers)]
+        column_list = ', '.join(f'"{col}"' for col in columns)
+        cursor.copy_expert(
+            f'COPY "{model.__tablename__}" ({column_list}) '
+            f"FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer
+        )
         
-        inserted = 0
-        for _, row in clean_data.iterrows():
-            record = PitcherPitchArsenalUsage(
-                player_id=int(row['pitcher']),  # Note: uses 'pitcher' column
-                year=2025,
-                player_name=row.get('last_name, first_name'),
-                n_ff=None if pd.isna(row.get('n_ff')) else float(row.get('n_ff')),
-                n_si=None if pd.isna(row.get('n_si')) else float(row.get('n_si')),
-                n_fc=None if pd.isna(row.get('n_fc')) else float(row.get('n_fc')),
-                n_sl=None if pd.isna(row.get('n_sl')) else float(row.get('n_sl')),
-                n_ch=None if pd.isna(row.get('n_ch')) else float(row.get('n_ch')),
-                n_cu=None if pd.isna(row.get('n_cu')) else float(row.get('n_cu')),
-                n_fs=None if pd.isna(row.get('n_fs')) else float(row.get('n_fs')),
-                n_kn=None if pd.isna(row.get('n_kn')) else float(row.get('n_kn')),
-                n_st=None if pd.isna(row.get('n_st')) else float(row.get('n_st')),
-                n_sv=None if pd.isna(row.get('n_sv')) else float(row.get('n_sv'))
-            )
-            self.session.add(record)
-            inserted += 1
+        # One sorted build per index instead of maintaining it row by row
+        self._recreate_indexes(session, model.__tablename__,
+                               self.index_defs.get(model.__tablename__, []))
         
-        self.stats['pitchers_processed'] += inserted
+        return count
     
     def get_stats(self):
 
-        return self.stats
+        with self._stats_lock:
+            return self.stats.copy()
     
     def close(self):
 
@@ -1,13 +1,117 @@
 #!/usr/bin/env python3
 
 import logging
-from datetime import datetime
 from typing import Dict, List, Optional
 
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from models import PlayerSplits, PitcherSplits, get_session
 
 logger = logging.getLogger(__name__)
 
+# Natural key each splits table upserts on (matches its unique constraint)
+UPSERT_KEYS = {
+    PlayerSplits: ('player_id', 'season', 'split_type'),
+    PitcherSplits: ('pitcher_id', 'season', 'split_type')
+}
+
+# Columns a record may carry into its upsert payload; id and the
+# timestamps are left to the database defaults
+PAYLOAD_COLUMNS = {
+    model: tuple(col.name for col in model.__table__.columns
+                 if col.name not in ('id', 'created_at', 'updated_at'))
+    for model in UPSERT_KEYS
+}
+
+# Rows per INSERT ... ON CONFLICT statement, each committed on its own;
+# capped per table so rows * columns stays under PostgreSQL's bind limit
+UPSERT_PAGE_SIZE = 1000
+MAX_BIND_PARAMS = 65535
+
+# Split categorization mapping
+CATEGORY_MAPPING = {
+    # Platoon splits
+    'vr': 'platoon',
+    'vl': 'platoon',
+    
+    # Location/time
+    'h': 'location',
+    'a': 'location',
+    'd': 'time',
+    'n': 'time',
+    'g': 'surface',
+    't': 'surface',
+    
+    # Situational/leverage
+    'risp': 'situational',
+    'risp2': 'situational', 
+    'lc': 'leverage',
+    'sah': 'score',
+    'sbh': 'score',
+    'sti': 'score',
+    'ac': 'count',
+    'bc': 'count',
+    '2s': 'count',
+    'ron': 'situational',
+    'ron2': 'situational',
+    'r0': 'situational',
+    
+    # Season timing
+    '4': 'monthly',
+    '5': 'monthly', 
+    '6': 'monthly',
+    '7': 'monthly',
+    '8': 'monthly',
+    '9': 'monthly',
+    
+    # Pitching specific
+    'sp': 'role',
+    'rp': 'role',
+    'pi000': 'fatigue'
+}
+
+# (model column, API stat key) pairs; stats are at top level, not nested
+HITTING_FIELDS = (
+    # Basic stats
+    ('games', 'gamesPlayed'),
+    ('games_started', 'gamesStarted'),
+    ('plate_appearances', 'plateAppearances'),
+    ('at_bats', 'atBats'),
+    ('runs', 'runs'),
+    ('hits', 'hits'),
+    ('doubles', 'doubles'),
+    ('triples', 'triples'),
+    ('home_runs', 'homeRuns'),
+    ('rbi', 'rbi'),
+    ('walks', 'baseOnBalls'),
+    ('strikeouts', 'strikeOuts'),
+    ('stolen_bases', 'stolenBases'),
+    ('caught_stealing', 'caughtStealing'),
+    
+    # Advanced stats
+    ('batting_average', 'avg'),
+    ('on_base_percentage', 'obp'),
+    ('slugging_percentage', 'slg'),
+    ('ops', 'ops')
+)
+
+PITCHING_FIELDS = (
+    ('games', 'gamesPlayed'),
+    ('games_started', 'gamesStarted'),
+    ('wins', 'wins'),
+    ('losses', 'losses'),
+    ('era', 'era'),
+    ('innings_pitched', 'inningsPitched'),
+    ('hits_allowed', 'hits'),
+    ('runs_allowed', 'runs'),
+    ('earned_runs', 'earnedRuns'),
+    ('home_runs_allowed', 'homeRuns'),
+    ('walks_allowed', 'baseOnBalls'),
+    ('strikeouts_pitched', 'strikeOuts'),
+    ('whip', 'whip')
+)
+
 class SplitsProcessor:
     
     def __init__(self, session=None):
@@ -20,79 +124,26 @@ class SplitsProcessor:
             'splits_loaded': 0,
             'splits_failed': 0
         }
-        
-        # Split categorization mapping
-        self.category_mapping = {
-            # Platoon splits
-            'vr': 'platoon',
-            'vl': 'platoon',
-            
-            # Location/time
-            'h': 'location',
-            'a': 'location',
-            'd': 'time',
-            'n': 'time',
-            'g': 'surface',
-            't': 'surface',
-            
-            # Situational/leverage
-            'risp': 'situational',
-            'risp2': 'situational', 
-            'lc': 'leverage',
-            'sah': 'score',
-            'sbh': 'score',
-            'sti': 'score',
-            'ac': 'count',
-            'bc': 'count',
-            '2s': 'count',
-            'ron': 'situational',
-            'ron2': 'situational',
-            'r0': 'situational',
-            
-            # Season timing
-            '4': 'monthly',
-            '5': 'monthly', 
-            '6': 'monthly',
-            '7': 'monthly',
-            '8': 'monthly',
-            '9': 'monthly',
-            
-            # Pitching specific
-            'sp': 'role',
-            'rp': 'role',
-            'pi000': 'fatigue'
-        }
     
-    def process_hitting_split(self, api_response: Dict, season: int, sitcode: str, description: str) -> List[PlayerSplits]:
-        splits_records = []
-        
-        try:
-            players_data = api_response.get('stats', [])
-            
-            for player_data in players_data:
-                split_record = self._create_hitting_split_record(
-                    player_data, season, sitcode, description
-                )
-                
-                if split_record:
-                    splits_records.append(split_record)
-                    self.stats['splits_processed'] += 1
-                    
-        except Exception as e:
-            logger.error(f"Error processing hitting split {sitcode}: {e}")
-            self.stats['splits_failed'] += 1
-            
-        return splits_records
+    def process_hitting_split(self, api_response: Dict, season: int, sitcode: str, description: str) -> List[Dict]:
+        return self._process_split(self._build_hitting_split_dict, 'hitting',
+                                   api_response, season, sitcode, description)
+    
+    def process_pitching_split(self, api_response: Dict, season: int, sitcode: str, description: str) -> List[Dict]:
+        return self._process_split(self._build_pitching_split_dict, 'pitching',
+                                   api_response, season, sitcode, description)
     
-    def process_pitching_split(self, api_response: Dict, season: int, sitcode: str, description: str) -> List[PitcherSplits]:
+    def _process_split(self, build, group: str, api_response: Dict, season: int, sitcode: str,
+                       description: str) -> List[Dict]:
         splits_records = []
+        split_category = CATEGORY_MAPPING.get(sitcode, 'other')
         
         try:
             players_data = api_response.get('stats', [])
             
             for player_data in players_data:
-                split_record = self._create_pitching_split_record(
-                    player_data, season, sitcode, description
+                split_record = build(
+                    player_data, season, sitcode, description, split_category=split_category
                 )
                 
                 if split_record:
@@ -100,155 +151,124 @@ class SplitsProcessor:
                     self.stats['splits_processed'] += 1
                     
         except Exception as e:
-            logger.error(f"Error processing pitching split {sitcode}: {e}")
+            logger.error("Error processing %s split %s: %s", group, sitcode, e)
             self.stats['splits_failed'] += 1
             
         return splits_records
     
-    def _create_hitting_split_record(self, player_data: Dict, season: int, sitcode: str, description: str) -> Optional[PlayerSplits]:
-        try:
-            player_id = player_data.get('playerId')
-            if not player_id:
-                return None
-                
-            # Get split categorization
-            split_category = self.category_mapping.get(sitcode, 'other')
-            
-            # Extract hitting stats (stats are at top level, not nested)
-            stats = player_data
-            
-            split_record = PlayerSplits(
-                player_id=player_id,
-                season=season,
-                split_category=split_category,
-                split_type=sitcode,
-                split_value=description,
-                
-                # Basic stats
-                games=stats.get('gamesPlayed'),
-                games_started=stats.get('gamesStarted'),
-                plate_appearances=stats.get('plateAppearances'),
-                at_bats=stats.get('atBats'),
-                runs=stats.get('runs'),
-                hits=stats.get('hits'),
-                doubles=stats.get('doubles'),
-                triples=stats.get('triples'),
-                home_runs=stats.get('homeRuns'),
-                rbi=stats.get('rbi'),
-                walks=stats.get('baseOnBalls'),
-                strikeouts=stats.get('strikeOuts'),
-                stolen_bases=stats.get('stolenBases'),
-                caught_stealing=stats.get('caughtStealing'),
-                
-                # Advanced stats
-                batting_average=stats.get('avg'),
-                on_base_percentage=stats.get('obp'),
-                slugging_percentage=stats.get('slg'),
-                ops=stats.get('ops'),
-                
-                # Timestamps
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            
-            return split_record
-            
-        except Exception as e:
-            logger.error(f"Error creating hitting split record for player {player_data.get('playerId', 'unknown')}: {e}")
+    def _build_hitting_split_dict(self, player_data: Dict, season: int, sitcode: str, description: str,
+                                  split_category: Optional[str] = None) -> Optional[Dict]:
+        player_id = player_data.get('playerId')
+        if not player_id:
             return None
+        
+        split_record = {
+            'player_id': player_id,
+            'season': season,
+            'split_category': split_category or CATEGORY_MAPPING.get(sitcode, 'other'),
+            'split_type': sitcode,
+            'split_value': description
+        }
+        # Only stats the API returned, so an upsert leaves the rest alone
+        split_record.update((dst, player_data[src]) for dst, src in HITTING_FIELDS if src in player_data)
+        
+        return split_record
     
-    def _create_pitching_split_record(self, player_data: Dict, season: int, sitcode: str, description: str) -> Optional[PitcherSplits]:
-        try:
-            player_id = player_data.get('playerId')
-            if not player_id:
-                return None
-                
-            # Get split categorization
-            split_category = self.category_mapping.get(sitcode, 'other')
-            
-            # Extract pitching stats (stats are at top level, not nested)
-            stats = player_data
-            
-            split_record = PitcherSplits(
-                pitcher_id=player_id,
-                season=season,
-                split_category=split_category,
-                split_type=sitcode,
-                split_value=description,
-                
-                # Pitching stats
-                games=stats.get('gamesPlayed'),
-                games_started=stats.get('gamesStarted'),
-                wins=stats.get('wins'),
-                losses=stats.get('losses'),
-                era=stats.get('era'),
-                innings_pitched=stats.get('inningsPitched'),
-                hits_allowed=stats.get('hits'),
-                runs_allowed=stats.get('runs'),
-                earned_runs=stats.get('earnedRuns'),
-                home_runs_allowed=stats.get('homeRuns'),
-                walks_allowed=stats.get('baseOnBalls'),
-                strikeouts_pitched=stats.get('strikeOuts'),
-                whip=stats.get('whip'),
-                
-                # Timestamps
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            
-            return split_record
-            
-        except Exception as e:
-            logger.error(f"Error creating pitching split record for player {player_data.get('playerId', 'unknown')}: {e}")
+    def _build_pitching_split_dict(self, player_data: Dict, season: int, sitcode: str, description: str,
+                                   split_category: Optional[str] = None) -> Optional[Dict]:
+        player_id = player_data.get('playerId')
+        if not player_id:
             return None
+        
+        split_record = {
+            'pitcher_id': player_id,
+            'season': season,
+            'split_category': split_category or CATEGORY_MAPPING.get(sitcode, 'other'),
+            'split_type': sitcode,
+            'split_value': description
+        }
+        split_record.update((dst, player_data[src]) for dst, src in PITCHING_FIELDS if src in player_data)
+        
+        return split_record
     
-    def bulk_upsert_splits(self, splits_records) -> int:
+    def bulk_upsert_splits(self, splits_records, model) -> int:
+        # Records are split dicts for `model` (from process_*_split) or
+        # PlayerSplits / PitcherSplits instances
+        if model not in UPSERT_KEYS:
+            raise ValueError(f"model must be PlayerSplits or PitcherSplits, got {model!r}")
+        
         # Create a new session for this operation to avoid concurrency issues
         session = get_session()
         
         try:
             loaded_count = 0
             
+            # Group payloads by model, keyed on the natural key so a repeated
+            # record replaces the earlier one (ON CONFLICT can't hit a row twice)
+            payloads = {split_model: {} for split_model in UPSERT_KEYS}
+            
+            # (target model, set-values getter) per record type, looked up
+            # by exact type once per record; instances only carry the
+            # attributes that were set
+            readers = {
+                dict: (model, lambda record: record),
+                PlayerSplits: (PlayerSplits, vars),
+                PitcherSplits: (PitcherSplits, vars)
+            }
             for split_record in splits_records:
-                # Determine the model type and appropriate query
-                if isinstance(split_record, PlayerSplits):
-                    existing = session.query(PlayerSplits).filter_by(
-                        player_id=split_record.player_id,
-                        season=split_record.season,
-                        split_type=split_record.split_type
-                    ).first()
-                elif isinstance(split_record, PitcherSplits):
-                    existing = session.query(PitcherSplits).filter_by(
-                        pitcher_id=split_record.pitcher_id,
-                        season=split_record.season,
-                        split_type=split_record.split_type
-                    ).first()
-                else:
+                record_model, values = readers.get(type(split_record), (None, None))
+                if record_model not in UPSERT_KEYS:
                     continue
                 
-                if existing:
-                    # Update existing record
-                    for attr in split_record.__dict__:
-                        if not attr.startswith('_') and attr != 'id':
-                            setattr(existing, attr, getattr(split_record, attr))
-                    existing.updated_at = datetime.now()
-                else:
-                    # Insert new record
-                    session.add(split_record)
+                values = values(split_record)
+                payload = {col: values[col] for col in PAYLOAD_COLUMNS[record_model] if col in values}
+                key = tuple(payload.get(col) for col in UPSERT_KEYS[record_model])
+                payloads[record_model][key] = payload
+            
+            for split_model, records in payloads.items():
+                # One statement shape per column set; each shape only
+                # overwrites the columns its rows carry
+                shapes = {}
+                for record in records.values():
+                    shapes.setdefault(tuple(sorted(record)), []).append(record)
                 
-                loaded_count += 1
+                for columns, shape_records in shapes.items():
+                    page_size = min(UPSERT_PAGE_SIZE, MAX_BIND_PARAMS // len(columns))
+                    for start in range(0, len(shape_records), page_size):
+                        page = shape_records[start:start + page_size]
+                        
+                        # Commit per page so a bad page only loses its own rows
+                        try:
+                            self._upsert_page(session, split_model, page)
+                            session.commit()
+                            loaded_count += len(page)
+                        except Exception as e:
+                            session.rollback()
+                            self.stats['splits_failed'] += len(page)
+                            logger.error("Error upserting %d %s rows: %s", len(page), split_model.__tablename__, e)
             
-            session.commit()
             self.stats['splits_loaded'] += loaded_count
             return loaded_count
             
         except Exception as e:
             session.rollback()
-            logger.error(f"Error bulk upserting splits: {e}")
+            logger.error("Error bulk upserting splits: %s", e)
             return 0
         finally:
             session.close()
     
+    def _upsert_page(self, session, model, records):
+        stmt = pg_insert(model.__table__).values(records)
+        
+        # Overwrite the page's columns except the key (created_at is never
+        # in the payload)
+        update_cols = [col for col in records[0] if col not in UPSERT_KEYS[model]]
+        set_ = {col: stmt.excluded[col] for col in update_cols}
+        set_['updated_at'] = func.now()
+        
+        stmt = stmt.on_conflict_do_update(index_elements=list(UPSERT_KEYS[model]), set_=set_)
+        session.execute(stmt)
+    
     def get_stats(self) -> Dict:
         return self.stats.copy()
         
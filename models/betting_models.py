@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import (
     Column,
     Integer,
@@ -10,13 +10,22 @@ from sqlalchemy import (
     Numeric,
     UniqueConstraint,
     Index,
-    DECIMAL
+    DECIMAL,
+    Enum,
+    func,
+    text
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
+def _utcnow():
+    # Timezone-aware default for the event-time columns below (moved_at etc.);
+    # created_at/updated_at are stamped by the database
+    return datetime.now(timezone.utc)
+
 class EspnOdds(Base):
     __tablename__ = 'espn_odds'
     
@@ -30,8 +39,8 @@ class EspnOdds(Base):
     espn_game_id = Column(String(20))
     
     # Bet type and side
-    bet_type = Column(String(20), nullable=False)  # moneyline, runline, total
-    bet_side = Column(String(10), nullable=False)  # home, away, over, under
+    bet_type = Column(Enum('moneyline', 'runline', 'total', name='bet_type_enum'), nullable=False)
+    bet_side = Column(Enum('home', 'away', 'over', 'under', name='bet_side_enum'), nullable=False)
     
     # Odds tracking (open, close, final)
     open_line = Column(String(10))    # For runline/total
@@ -52,8 +61,8 @@ class EspnOdds(Base):
     provider_name = Column(String(50), default="ESPN BET")
     
     # Tracking
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
 
@@ -64,8 +73,8 @@ class FanDuelBook(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(50), unique=True, nullable=False)  # e.g., "FanDuel"
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 class FanDuelEvent(Base):
     __tablename__ = "fd_events"
@@ -78,16 +87,16 @@ class FanDuelEvent(Base):
     competition_id = Column(String(30))            # e.g., "11196870"
     event_type_id = Column(String(30))             # e.g., "7511"
     country_code = Column(String(5))               # e.g., "US"/"GB"
-    event_name = Column(String(200))               # Full display name
-    market_group = Column(String(100))             # e.g., "MLB", "MLB - Player Markets"
-    open_date = Column(DateTime)
+    event_name = Column(Text)                      # Full display name
+    market_group = Column(Text)                    # e.g., "MLB", "MLB - Player Markets"
+    open_date = Column(DateTime(timezone=True))
     status = Column(String(20))                    # OPEN/CLOSED/etc.
 
     # Linkage to MLB game if resolvable
     game_pk = Column(Integer, index=True, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     markets = relationship("FanDuelMarket", back_populates="event")
@@ -105,10 +114,10 @@ class FanDuelMarket(Base):
 
     # FanDuel identifiers/fields
     book_market_id = Column(String(40), nullable=False, unique=True)  # e.g., "734.135624394"
-    market_type = Column(String(100))          # e.g., "MATCH_HANDICAP_(2-WAY)", "PLAYER_TO_RECORD_A_HIT"
-    market_name = Column(String(200))          # e.g., "Run Line", "To Record A Hit"
+    market_type = Column(Text)                 # e.g., "MATCH_HANDICAP_(2-WAY)", "PLAYER_TO_RECORD_A_HIT"
+    market_name = Column(Text)                 # e.g., "Run Line", "To Record A Hit"
     market_level = Column(String(30))          # e.g., "AVB_EVENT", "COMPETITION"
-    market_time = Column(DateTime)             # ISO from API
+    market_time = Column(DateTime(timezone=True))  # ISO from API
     in_play = Column(Boolean, default=False)
     sgm_market = Column(Boolean, default=False)
     status = Column(String(20))                # OPEN/CLOSED/etc.
@@ -118,22 +127,26 @@ class FanDuelMarket(Base):
     market_key = Column(String(100), index=True)       # run_line | total_runs | pitcher_strikeouts | ...
     source_category_id = Column(Integer, index=True)   # Book-native category id (e.g., DK 493)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     event = relationship("FanDuelEvent", back_populates="markets")
     runners = relationship("FanDuelRunner", back_populates="market")
     prices = relationship("FanDuelPrice", back_populates="market")
 
+    __table_args__ = (
+        Index("ix_fd_market_event_cat", "event_id", "market_category"),
+    )
+
 class FanDuelRunner(Base):
     __tablename__ = "fd_runners"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     market_id = Column(Integer, ForeignKey("fd_markets.id"), nullable=False)
 
-    selection_id = Column(String(128), index=True)  # Book selection identifier (FanDuel/DK)
-    runner_name = Column(String(150))
+    selection_id = Column(String(128))  # Book selection identifier (FanDuel/DK)
+    runner_name = Column(Text)
     handicap = Column(Numeric(10, 3))              # spread/total line if applicable
     is_player = Column(Boolean, default=False)
     runner_status = Column(String(20))
@@ -144,8 +157,8 @@ class FanDuelRunner(Base):
     team_mlb_id = Column(Integer, nullable=True)
     team_abbrev = Column(String(10))
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     market = relationship("FanDuelMarket", back_populates="runners")
@@ -163,9 +176,9 @@ class FanDuelPrice(Base):
     runner_id = Column(Integer, ForeignKey("fd_runners.id"), nullable=True)
 
     # Keys to identify selection if runner row not created yet
-    selection_id = Column(String(128), index=True)
+    selection_id = Column(String(128))
 
-    fetched_at = Column(DateTime, default=datetime.utcnow, index=True)
+    fetched_at = Column(DateTime(timezone=True))  # Set once per scrape by the caller
     in_play = Column(Boolean, default=False)
 
     # Odds formats
@@ -178,17 +191,25 @@ class FanDuelPrice(Base):
     # Line context when applicable (totals/spreads/handicaps)
     line = Column(Numeric(10, 3))
 
-    # Raw payloads for audit/debug
-    raw_price_json = Column(Text)
+    # Raw payloads for audit/debug; JSONB so fields can be read in SQL
+    raw_price_json = Column(JSONB)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     market = relationship("FanDuelMarket", back_populates="prices")
     runner = relationship("FanDuelRunner", back_populates="prices")
 
     __table_args__ = (
+        # One row per selection per snapshot; re-sent snapshots are skipped
+        UniqueConstraint("market_id", "selection_id", "fetched_at", name="uq_fd_price_snapshot"),
         Index("ix_fd_price_market_time", "market_id", "fetched_at"),
+        # Per-runner odds timeline served from the index alone
+        Index("ix_fd_price_runner_time", "runner_id", "fetched_at",
+              postgresql_include=["american_odds", "line"]),
+        # Append-only, so rows arrive in fetched_at order; a BRIN index covers
+        # time-range scans at a fraction of a B-tree's size and write cost
+        Index("ix_fd_price_fetched_brin", "fetched_at", postgresql_using="brin"),
     )
 
 class FanDuelLineMovement(Base):
@@ -198,21 +219,21 @@ class FanDuelLineMovement(Base):
     book_id = Column(Integer, ForeignKey("fd_books.id"), nullable=False)
     market_id = Column(Integer, ForeignKey("fd_markets.id"), nullable=False)
     runner_id = Column(Integer, ForeignKey("fd_runners.id"), nullable=True)
-    selection_id = Column(String(128), index=True)
+    selection_id = Column(String(128))
 
     old_line = Column(Numeric(10,3))
     new_line = Column(Numeric(10,3))
     old_american_odds = Column(Integer)
     new_american_odds = Column(Integer)
     movement_type = Column(String(20))  # line_up/line_down/odds_up/odds_down/new
-    moved_at = Column(DateTime, default=datetime.utcnow)
+    moved_at = Column(DateTime(timezone=True), default=_utcnow)
 
 class FanDuelTeamAlias(Base):
     __tablename__ = "fd_team_aliases"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     book_name = Column(String(50), nullable=False)        # e.g., FanDuel
-    book_team = Column(String(100), nullable=False)       # display name the book uses
+    book_team = Column(Text, nullable=False)              # display name the book uses
     mlb_team_abbrev = Column(String(10))
     mlb_team_id = Column(Integer)
 
@@ -226,7 +247,7 @@ class FanDuelPlayerAlias(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     book_name = Column(String(50), nullable=False)
     selection_id = Column(String(40), nullable=True)      # FanDuel selectionId if stable
-    runner_name = Column(String(150), nullable=False)
+    runner_name = Column(Text, nullable=False)
     mlb_player_id = Column(Integer)
 
     __table_args__ = (
@@ -246,7 +267,7 @@ class FanDuelSettlement(Base):
     result = Column(String(10))                # win | loss | push
     final_line = Column(Numeric(10,3))
     actual_value = Column(Numeric(10,3))
-    settled_at = Column(DateTime, default=datetime.utcnow)
+    settled_at = Column(DateTime(timezone=True), default=_utcnow)
 
     note = Column(Text)                        # optional context (e.g., final score)
 
@@ -257,16 +278,16 @@ class PrizePicksPlayer(Base):
     
     id = Column(Integer, primary_key=True)
     prizepicks_player_id = Column(String(50), unique=True, nullable=False)  # "67499"
-    name = Column(String(100))                                              # "Carson Kelly"
-    display_name = Column(String(100))                                      # Same as name usually
+    name = Column(Text)                                                     # "Carson Kelly"
+    display_name = Column(Text)                                             # Same as name usually
     team = Column(String(10))                                               # "CHC"
-    team_name = Column(String(50))                                          # "Cubs"
+    team_name = Column(Text)                                                # "Cubs"
     position = Column(String(10))                                           # "C", "1B", etc.
     jersey_number = Column(String(10))                                      # "15"
     league = Column(String(10), default='MLB')
     image_url = Column(Text)                                                # Player photo URL
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
 class PrizePicksTeam(Base):
     """Team data from PrizePicks"""
@@ -275,11 +296,11 @@ class PrizePicksTeam(Base):
     id = Column(Integer, primary_key=True)
     prizepicks_team_id = Column(String(50), unique=True, nullable=False)    # "2657"
     team_code = Column(String(10))                                          # "CHC"
-    team_name = Column(String(50))                                          # "Cubs"
-    market = Column(String(50))                                             # "Chicago"
+    team_name = Column(Text)                                                # "Cubs"
+    market = Column(Text)                                                   # "Chicago"
     league = Column(String(10), default='MLB')
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 class PrizePicksGame(Base):
     """Game information from PrizePicks"""
@@ -288,10 +309,10 @@ class PrizePicksGame(Base):
     id = Column(Integer, primary_key=True)
     prizepicks_game_id = Column(String(50), unique=True, nullable=False)    # "60966"
     external_game_id = Column(String(100))                                  # "MLB_game_OgkEVJi8ECp64BudemBSIw7u"
-    start_time = Column(DateTime)
+    start_time = Column(DateTime(timezone=True))
     status = Column(String(20))                                             # From projections
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
 class PrizePicksProjection(Base):
     """Main betting props table - current active props"""
@@ -301,18 +322,23 @@ class PrizePicksProjection(Base):
     prizepicks_id = Column(String(50), unique=True, nullable=False)         # "5836744"
     player_id = Column(Integer, ForeignKey('prizepicks_players.id'))
     game_id = Column(Integer, ForeignKey('prizepicks_games.id'))
-    stat_type = Column(String(50))                                          # "Total Bases", "Hits", etc.
+    stat_type = Column(Text)                                                # "Total Bases", "Hits", etc.
     current_line_score = Column(DECIMAL(5,2))                               # Current line: 3.5, 1.5, etc.
-    description = Column(String(100))                                       # "BAL" (team abbreviation)
+    description = Column(Text)                                              # "BAL" (team abbreviation)
     status = Column(String(20))                                             # "pre_game", "live", etc.
-    start_time = Column(DateTime)                                           # When game starts
-    board_time = Column(DateTime)                                           # When prop was first posted
-    last_updated = Column(DateTime)                                         # Last time we saw this prop
+    start_time = Column(DateTime(timezone=True))                            # When game starts
+    board_time = Column(DateTime(timezone=True))                            # When prop was first posted
+    last_updated = Column(DateTime(timezone=True))                          # Last time we saw this prop
     is_live = Column(Boolean, default=False)
     is_promo = Column(Boolean, default=False)
     odds_type = Column(String(20))                                          # "demon", "standard", etc.
     is_active = Column(Boolean, default=True)                               # False when prop is removed/settled
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # Settler scans active props by start_time; settled rows drop out
+        Index("ix_pp_active_start", "start_time", postgresql_where=text("is_active")),
+    )
 
 class PrizePicksSettlement(Base):
     """Settlement results for PrizePicks projections"""
@@ -322,14 +348,14 @@ class PrizePicksSettlement(Base):
     projection_id = Column(Integer, ForeignKey('prizepicks_projections.id'), unique=True, nullable=False)
     final_line_score = Column(DECIMAL(5,2), nullable=False)                 # Line at settlement time
     actual_result = Column(DECIMAL(5,2), nullable=False)                    # Actual stat value achieved
-    settlement_result = Column(String(10), nullable=False)                  # "over", "under", "push"
-    settled_at = Column(DateTime, default=datetime.utcnow)
+    settlement_result = Column(Enum('over', 'under', 'push', name='settlement_result_enum'), nullable=False)
+    settled_at = Column(DateTime(timezone=True), default=_utcnow)
     
     # Optional metadata
     game_pk = Column(Integer)                                               # MLB game_pk if matched
-    player_name_used = Column(String(100))                                  # Name used for matching
+    player_name_used = Column(Text)                                         # Name used for matching
     notes = Column(Text)                                                    # Any issues or special cases
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
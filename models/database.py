@@ -1,27 +1,58 @@
+import csv
+import io
+import json
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from datetime import datetime, timezone
+from functools import lru_cache
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy.sql import functions
 from dotenv import load_dotenv
 
 # Import all model bases to ensure they're registered
 from .mlb_models import Base as MLBBase
 from .betting_models import Base as BettingBase  
 from .season_models import Base as SeasonBase
+from .betting_models import FanDuelEvent, FanDuelMarket
+from .mlb_models import Game, ARSENAL_USAGE_PITCH_TYPES
+from .season_models import PlayerSeasonStats
 
 load_dotenv()
 
+# psycopg2 batching: multi-row VALUES for INSERTs, execute_batch for the
+# UPDATE/DELETE executemanys the ORM flushes
+ENGINE_OPTIONS = {
+    'executemany_mode': 'values_plus_batch',
+    'insertmanyvalues_page_size': 10_000,
+    'executemany_batch_page_size': 500,
+    
+    # One shared pool per process (see get_database_engine)
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800
+}
+
+# Bind parameters per bulk INSERT chunk, under PostgreSQL's 65535 cap
+BULK_INSERT_MAX_PARAMS = 32000
+
+# Rows of one shape above which bulk_upsert_rows COPYs into a temp table
+# and upserts from there instead of sending INSERT ... VALUES pages
+COPY_UPSERT_MIN_ROWS = 2000
+
+@lru_cache(maxsize=1)
 def get_database_engine():
+    # Built once; every get_session() shares this engine's connection pool
+    db_url = os.getenv('DATABASE_URL')
     try:
         from core.logger import setup_logger
         logger = setup_logger("database")
-        db_url = os.getenv('DATABASE_URL')
         logger.info(f"Connecting to database: {db_url.split('@')[1]}")
-        return create_engine(db_url)
     except ImportError:
         # Fallback if logger not available
-        db_url = os.getenv('DATABASE_URL')
         print(f"Connecting to database: {db_url.split('@')[1]}")
-        return create_engine(db_url)
+    return create_engine(db_url, **ENGINE_OPTIONS)
 
 def create_all_tables():
     try:
@@ -35,6 +66,7 @@ def create_all_tables():
         MLBBase.metadata.create_all(engine)
         BettingBase.metadata.create_all(engine)
         SeasonBase.metadata.create_all(engine)
+        create_season_partitions(engine)
         
         logger.info("All tables created successfully")
     except ImportError:
@@ -46,40 +78,520 @@ def create_all_tables():
         MLBBase.metadata.create_all(engine)
         BettingBase.metadata.create_all(engine) 
         SeasonBase.metadata.create_all(engine)
+        create_season_partitions(engine)
         
         print("All tables created successfully")
 
-def get_session():
+def get_session(**options):
+    # options go to sessionmaker, e.g. autoflush/expire_on_commit for bulk loads
     engine = get_database_engine()
-    Session = sessionmaker(bind=engine)
+    Session = sessionmaker(bind=engine, **options)
     return Session()
 
+def bulk_insert_rows(session, model, rows, skip_conflicts=False):
+    # Plain-dict rows go through one executemany per chunk (multi-row
+    # INSERT ... VALUES) instead of per-object session.add(); Python-side
+    # column defaults such as in_play still apply. skip_conflicts adds
+    # ON CONFLICT DO NOTHING so a re-sent batch is a no-op; the count
+    # returned is then the rows actually inserted, taken from RETURNING
+    # since rowcount isn't reliable for executemany
+    if not rows:
+        return 0
+    chunk_size = max(1, BULK_INSERT_MAX_PARAMS // len(model.__table__.columns))
+    if not skip_conflicts:
+        stmt = insert(model.__table__)
+        for start in range(0, len(rows), chunk_size):
+            session.execute(stmt, rows[start:start + chunk_size])
+        return len(rows)
+    
+    stmt = pg_insert(model.__table__).on_conflict_do_nothing().returning(*model.__table__.primary_key.columns)
+    inserted = 0
+    for start in range(0, len(rows), chunk_size):
+        inserted += len(session.execute(stmt, rows[start:start + chunk_size]).all())
+    return inserted
+
+def _onupdate_values(table, columns):
+    # ON CONFLICT DO UPDATE skips Column(onupdate=...), so apply SQL-side
+    # onupdate defaults (last_updated / updated_at = now()) for columns the
+    # rows don't set themselves
+    return {
+        col.name: col.onupdate.arg for col in table.columns
+        if col.onupdate is not None and col.onupdate.is_clause_element and col.name not in columns
+    }
+
+@lru_cache(maxsize=None)
+def _upsert_statement(table, columns, key_columns):
+    # One statement object per (table, column set) for the life of the
+    # process, so batches reuse it instead of rebuilding the ON CONFLICT
+    # clause; its compiled form is then found in the engine's cache
+    stmt = pg_insert(table)
+    set_ = {col: stmt.excluded[col] for col in columns if col not in key_columns}
+    set_.update(_onupdate_values(table, columns))
+    if set_:
+        return stmt.on_conflict_do_update(index_elements=list(key_columns), set_=set_)
+    return stmt.on_conflict_do_nothing(index_elements=list(key_columns))
+
+def bulk_upsert_rows(session, model, rows, key_columns):
+    # INSERT ... ON CONFLICT (key_columns) DO UPDATE, one executemany per
+    # chunk. Rows are grouped by the columns they carry and only those are
+    # overwritten on conflict, so a partial row (e.g. pitching-only season
+    # stats) leaves the rest of an existing row alone
+    if not rows:
+        return 0
+    chunk_size = max(1, BULK_INSERT_MAX_PARAMS // len(model.__table__.columns))
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    
+    for columns, group in groups.items():
+        if len(group) >= COPY_UPSERT_MIN_ROWS:
+            _copy_upsert(session, model.__table__, columns, key_columns, group)
+            continue
+        stmt = _upsert_statement(model.__table__, columns, tuple(key_columns))
+        for start in range(0, len(group), chunk_size):
+            session.execute(stmt, group[start:start + chunk_size])
+    return len(rows)
+
+def _copy_upsert(session, table, columns, key_columns, rows, update=True):
+    # Large refreshes: COPY the rows into a temp table holding just these
+    # columns, then one INSERT ... SELECT ... ON CONFLICT into the real
+    # table (DO NOTHING when not `update`). Python-side column defaults
+    # don't run on this path. Returns the number of rows inserted or updated
+    dialect = session.get_bind().dialect
+    assignments = []
+    if update:
+        assignments = [f'{col} = EXCLUDED.{col}' for col in columns if col not in key_columns]
+        assignments += [f'{col} = {value.compile(dialect=dialect)}'
+                        for col, value in _onupdate_values(table, columns).items()]
+    on_conflict = f"DO UPDATE SET {', '.join(assignments)}" if assignments else "DO NOTHING"
+    column_list = ', '.join(columns)
+    
+    session.execute(text(
+        f'CREATE TEMP TABLE tmp_upsert ON COMMIT DROP AS SELECT {column_list} FROM "{table.name}" WITH NO DATA'
+    ))
+    _copy_csv(session, 'tmp_upsert', columns, ([row[col] for col in columns] for row in rows))
+    result = session.execute(text(
+        f'INSERT INTO "{table.name}" ({column_list}) SELECT {column_list} FROM tmp_upsert '
+        f"ON CONFLICT ({', '.join(key_columns)}) {on_conflict}"
+    ))
+    session.execute(text("DROP TABLE tmp_upsert"))
+    return result.rowcount
+
+# fd_prices columns a COPY backfill writes; COPY skips the models' Python
+# defaults, so copy_prices fills in in_play (created_at is a server default)
+PRICE_COPY_COLUMNS = (
+    'market_id', 'runner_id', 'selection_id', 'fetched_at', 'in_play', 'american_odds',
+    'decimal_odds', 'fractional_numerator', 'fractional_denominator', 'true_decimal_odds',
+    'line', 'raw_price_json'
+)
+
+def _copy_csv(session, table, columns, rows):
+    # COPY FROM STDIN on the session's connection; rows are sequences in
+    # `columns` order with None written as \N. Caller commits
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(['\\N' if value is None else value for value in row])
+    buffer.seek(0)
+    
+    cursor = session.connection().connection.cursor()
+    cursor.copy_expert(
+        f'COPY "{table}" ({", ".join(columns)}) '
+        f"FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        buffer
+    )
+
+def _database_filled(col):
+    # now() timestamps (created_at/updated_at/last_updated) and generated
+    # columns; literal server defaults still come from the row
+    if col.computed is not None:
+        return True
+    return isinstance(getattr(col.server_default, 'arg', None), functions.now)
+
+def copy_columns(model):
+    # A model's COPY column list in table order, minus the columns the
+    # database fills itself
+    return tuple(col.name for col in model.__table__.columns if not _database_filled(col))
+
+def copy_rows(session, model, rows):
+    # Bulk loads of the wide game tables (statcast_pitches, batted_balls, ...):
+    # COPY dict rows instead of INSERTs, with the model as the single source
+    # of column order. COPY skips Python-side defaults and ON CONFLICT, so
+    # rows must be complete and new; caller commits
+    if not rows:
+        return 0
+    columns = copy_columns(model)
+    _copy_csv(session, model.__tablename__, columns, ([row.get(col) for col in columns] for row in rows))
+    return len(rows)
+
+def replace_season_rows(session, model, season, rows):
+    # Full-season refresh of a season stats table: one DELETE of the
+    # season's rows and one COPY of the new ones in the same transaction,
+    # instead of upserting row by row. Readers see the old season until
+    # the caller commits. The API is the source of truth, so the commit
+    # doesn't wait for the WAL flush
+    session.execute(text("SET LOCAL synchronous_commit = off"))
+    session.execute(model.__table__.delete().where(model.__table__.c.season == season))
+    return copy_rows(session, model, rows)
+
+def copy_prices(session, rows, table='fd_prices'):
+    # Historical backfills: COPY price dicts into a temp table, then one
+    # INSERT ... ON CONFLICT DO NOTHING on uq_fd_price_snapshot, so a rerun
+    # of a partly loaded backfill skips the snapshots already stored.
+    # Every row needs its own fetched_at. Returns the rows inserted; caller
+    # commits
+    if not rows:
+        return 0
+    
+    values_rows = []
+    for row in rows:
+        if row.get('fetched_at') is None:
+            raise ValueError(
+                f"copy_prices row for market {row.get('market_id')} selection "
+                f"{row.get('selection_id')} has no fetched_at"
+            )
+        values = {'in_play': False, **{k: v for k, v in row.items() if v is not None}}
+        if isinstance(values.get('raw_price_json'), (dict, list)):
+            values['raw_price_json'] = json.dumps(values['raw_price_json'])
+        values_rows.append({col: values.get(col) for col in PRICE_COPY_COLUMNS})
+    
+    return _copy_upsert(
+        session, BettingBase.metadata.tables[table], PRICE_COPY_COLUMNS,
+        ('market_id', 'selection_id', 'fetched_at'), values_rows, update=False
+    )
+
+def load_event_tree(session, event_id, include_prices=False):
+    # Event with its markets and runners (and optionally prices) in one
+    # IN-list SELECT per level rather than a lazy load per parent; the
+    # relationships stay lazy so ingestion lookups don't pull the tree
+    markets = selectinload(FanDuelEvent.markets)
+    options = [markets.selectinload(FanDuelMarket.runners)]
+    if include_prices:
+        options.append(markets.selectinload(FanDuelMarket.prices))
+    return session.query(FanDuelEvent).options(*options).filter(FanDuelEvent.id == event_id).first()
+
+def load_games(session, game_pks, *collections):
+    # Games plus the named child collections ('box_scores', 'pitches', ...),
+    # one IN-list SELECT per collection across all games
+    options = [selectinload(getattr(Game, name)) for name in collections]
+    return session.query(Game).options(*options).filter(Game.game_pk.in_(game_pks)).all()
+
+def iter_player_season_rows(engine, season, columns=None, batch_size=5000):
+    # Read-only scans of player_season_stats as plain driver tuples (in
+    # `columns` order, default all) through a server-side cursor, for exports
+    # that would otherwise build a 60-column ORM object per row
+    columns = list(columns or [col.name for col in PlayerSeasonStats.__table__.columns])
+    unknown = set(columns) - set(PlayerSeasonStats.__table__.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown player_season_stats columns: {sorted(unknown)}")
+    
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor(name='player_season_scan')
+        cursor.itersize = batch_size
+        cursor.execute(
+            f"SELECT {', '.join(columns)} FROM player_season_stats WHERE season = %s ORDER BY player_id",
+            (season,)
+        )
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            yield from batch
+        cursor.close()
+    finally:
+        # Ends the read transaction and returns the connection to the pool
+        raw.rollback()
+        raw.close()
+
 # Individual sportsbook table creation functions
+def _create_betting_tables(engine, prefix):
+    # One create_all so existence is checked on a single connection, in
+    # FK dependency order
+    tables = [table for table in BettingBase.metadata.tables.values()
+              if table.name.startswith(prefix)]
+    BettingBase.metadata.create_all(engine, tables=tables, checkfirst=True)
+
 def create_draftkings_tables(engine):
-    dk_tables = [table for table in BettingBase.metadata.tables.values() 
-                 if table.name.startswith('dk_')]
-    for table in dk_tables:
-        table.create(engine, checkfirst=True)
+    _create_betting_tables(engine, 'dk_')
 
 def create_fanduel_tables(engine):
-    fd_tables = [table for table in BettingBase.metadata.tables.values() 
-                 if table.name.startswith('fd_')]
-    for table in fd_tables:
-        table.create(engine, checkfirst=True)
+    _create_betting_tables(engine, 'fd_')
 
 def create_prizepicks_tables(engine):
-    pp_tables = [table for table in BettingBase.metadata.tables.values() 
-                 if table.name.startswith('prizepicks_')]
-    for table in pp_tables:
-        table.create(engine, checkfirst=True)
+    _create_betting_tables(engine, 'prizepicks_')
     print("Created PrizePicks tables successfully")
 
+# Latest FanDuel price per runner, flattened for read-heavy odds queries.
+# Unique on (market_id, runner_id) so it can be refreshed CONCURRENTLY
+CURRENT_ODDS_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_current_odds AS
+SELECT e.game_pk, e.event_name, m.id AS market_id, m.market_key, m.market_category,
+       r.id AS runner_id, r.runner_name, p.american_odds, p.decimal_odds, p.line, p.fetched_at
+FROM fd_events e
+JOIN fd_markets m ON m.event_id = e.id
+JOIN fd_runners r ON r.market_id = m.id
+JOIN LATERAL (
+    SELECT american_odds, decimal_odds, line, fetched_at
+    FROM fd_prices
+    WHERE runner_id = r.id
+    ORDER BY fetched_at DESC
+    LIMIT 1
+) p ON true
+"""
+
+def create_current_odds_view(engine):
+    with engine.begin() as conn:
+        conn.execute(text(CURRENT_ODDS_VIEW_SQL))
+        conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_current_odds ON mv_current_odds (market_id, runner_id)"
+        ))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_mv_current_odds_game ON mv_current_odds (game_pk)"))
+    print("Created mv_current_odds view successfully")
+
+def refresh_current_odds_view(engine):
+    # Call after each price load; CONCURRENTLY keeps the view readable
+    with engine.begin() as conn:
+        conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_current_odds"))
+
+# Per-season roll-ups over the game and season stats tables:
+# name -> (SELECT, unique key). Final games don't change, so a refresh after
+# each day's ETL is enough; the unique index lets REFRESH ... CONCURRENTLY
+# keep them readable
+SEASON_ROLLUP_VIEWS = {
+    'mv_pitcher_season_pitchmix': ("""
+        SELECT p.pitcher_id, p.season, p.pitch_type, COUNT(*) AS pitches,
+               AVG(p.release_speed) AS avg_velo, AVG(p.release_spin_rate) AS avg_spin,
+               AVG(p.pfx_x) AS avg_pfx_x, AVG(p.pfx_z) AS avg_pfx_z
+        FROM statcast_pitches p
+        GROUP BY p.pitcher_id, p.season, p.pitch_type
+    """, ('pitcher_id', 'season', 'pitch_type')),
+    'mv_batter_season_quality_of_contact': ("""
+        SELECT b.batter_id, b.season, COUNT(*) AS batted_balls,
+               AVG(b.exit_velocity) AS avg_exit_velocity, MAX(b.exit_velocity) AS max_exit_velocity,
+               AVG(b.launch_angle) AS avg_launch_angle, AVG(b.hit_distance) AS avg_distance,
+               AVG((b.exit_velocity >= 95)::int) AS hard_hit_rate
+        FROM batted_balls b
+        GROUP BY b.batter_id, b.season
+    """, ('batter_id', 'season')),
+    'mv_game_scoreboard': ("""
+        SELECT g.game_pk, g.season, g.official_date, g.status_abstract,
+               g.home_team_id, g.home_team_abbreviation, g.home_score, g.home_hits, g.home_errors,
+               g.away_team_id, g.away_team_abbreviation, g.away_score, g.away_hits, g.away_errors,
+               array_agg(ls.runs ORDER BY ls.inning) FILTER (WHERE ls.team_type = 'home') AS home_runs_by_inning,
+               array_agg(ls.runs ORDER BY ls.inning) FILTER (WHERE ls.team_type = 'away') AS away_runs_by_inning
+        FROM games g
+        LEFT JOIN game_line_scores ls ON ls.game_pk = g.game_pk
+        GROUP BY g.game_pk
+    """, ('game_pk',)),
+    'mv_division_standings': ("""
+        SELECT t.season, t.league_id, t.division_id, t.team_id, t.team_abbreviation,
+               t.wins, t.losses, t.winning_percentage, t.games_back_division,
+               t.run_differential,
+               RANK() OVER (PARTITION BY t.season, t.division_id
+                            ORDER BY t.winning_percentage DESC) AS division_rank,
+               RANK() OVER (PARTITION BY t.season, t.league_id
+                            ORDER BY t.winning_percentage DESC) AS league_rank
+        FROM team_season_stats t
+    """, ('season', 'team_id'))
+}
+
+def create_season_rollup_views(engine):
+    with engine.begin() as conn:
+        for name, (select, key) in SEASON_ROLLUP_VIEWS.items():
+            conn.execute(text(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} AS {select}"))
+            conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{name} ON {name} ({', '.join(key)})"))
+    print("Created season roll-up views successfully")
+
+def refresh_season_rollup_views(engine):
+    # Call at the end of a day's ETL
+    with engine.begin() as conn:
+        for name in SEASON_ROLLUP_VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+
+# players joined back to its player_bio side table, for readers that want
+# the old wide players row
+PLAYERS_FULL_VIEW_SQL = """
+CREATE OR REPLACE VIEW players_full AS
+SELECT p.*, b.height, b.weight, b.birth_date, b.mlb_debut_date,
+       b.birth_city, b.birth_country, b.birth_state_province
+FROM players p
+LEFT JOIN player_bio b USING (mlb_id)
+"""
+
+def create_players_full_view(engine):
+    with engine.begin() as conn:
+        conn.execute(text(PLAYERS_FULL_VIEW_SQL))
+    print("Created players_full view successfully")
+
+# The old wide pitcher_pitch_arsenal_usage layout (one n_* column per pitch
+# type) rebuilt over pitcher_pitch_usage for existing readers
+PITCH_ARSENAL_USAGE_VIEW_SQL = """
+CREATE OR REPLACE VIEW pitcher_pitch_arsenal_usage AS
+SELECT player_id, year, MAX(player_name) AS player_name,
+       %s
+FROM pitcher_pitch_usage
+GROUP BY player_id, year
+""" % ',\n       '.join(
+    f"MAX(pitch_usage) FILTER (WHERE pitch_type = '{pitch_type}') AS {col}"
+    for col, pitch_type in ARSENAL_USAGE_PITCH_TYPES.items()
+)
+
+def create_pitch_arsenal_usage_view(engine):
+    # The pitcher_pitch_arsenal_usage table has to be dropped first
+    with engine.begin() as conn:
+        conn.execute(text(PITCH_ARSENAL_USAGE_VIEW_SQL))
+    print("Created pitcher_pitch_arsenal_usage view successfully")
+
+# Tables read a game at a time, and the game_pk-leading index to order each
+# heap by. Rows arrive game by game but updates and reloads scatter them;
+# CLUSTER puts a game's rows back on adjacent pages
+GAME_CLUSTER_INDEXES = {
+    'statcast_pitches': 'ix_statcast_pitch_game_inning',
+    'batted_balls': 'ix_batted_ball_game_inning',
+    'game_wpa': 'ix_game_wpa_game_pk',
+    'game_line_scores': 'game_line_scores_pkey',
+    'box_scores': 'box_scores_pkey'
+}
+
+def cluster_game_tables(engine):
+    # Takes an ACCESS EXCLUSIVE lock per table; run after the nightly ETL
+    for table, index in GAME_CLUSTER_INDEXES.items():
+        with engine.begin() as conn:
+            conn.execute(text(f"CLUSTER {table} USING {index}"))
+            conn.execute(text(f"ANALYZE {table}"))
+
+# Multi-column planner statistics: name -> (table, kinds, columns). A
+# pitcher throws only a handful of pitch types, so the per-column estimates
+# multiply out far too many (pitcher_id, pitch_type) groups
+EXTENDED_STATISTICS = {
+    'st_statcast_pitch_pitcher_type': ('statcast_pitches', 'ndistinct', ('pitcher_id', 'pitch_type'))
+}
+
+def create_extended_statistics(engine):
+    # The statistics stay empty until the table is analyzed, so do that here
+    with engine.begin() as conn:
+        for name, (table, kinds, columns) in EXTENDED_STATISTICS.items():
+            conn.execute(text(
+                f"CREATE STATISTICS IF NOT EXISTS {name} ({kinds}) ON {', '.join(columns)} FROM {table}"
+            ))
+        for table in {table for table, _, _ in EXTENDED_STATISTICS.values()}:
+            conn.execute(text(f"ANALYZE {table}"))
+
+def _export_to_parquet(engine, sql, params, out_dir, partition_col, chunksize):
+    # Streams `sql` in chunks and writes hive-style
+    # out_dir/<partition_col>=<value>/part-NNNNN.parquet files (zstd; needs
+    # pyarrow). Partitions written by this run are cleared first, so a
+    # re-export replaces rather than appends
+    import pandas as pd
+    
+    exported = 0
+    cleared = set()
+    with engine.connect().execution_options(stream_results=True) as conn:
+        chunks = pd.read_sql_query(text(sql), conn, params=params, chunksize=chunksize)
+        for n, chunk in enumerate(chunks):
+            for value, rows in chunk.groupby(partition_col):
+                part_dir = os.path.join(out_dir, f"{partition_col}={value}")
+                if part_dir not in cleared:
+                    os.makedirs(part_dir, exist_ok=True)
+                    for name in os.listdir(part_dir):
+                        if name.endswith('.parquet'):
+                            os.remove(os.path.join(part_dir, name))
+                    cleared.add(part_dir)
+                rows.drop(columns=partition_col).to_parquet(
+                    os.path.join(part_dir, f"part-{n:05d}.parquet"), compression='zstd', index=False
+                )
+                exported += len(rows)
+    return exported
+
+# Cold fd_prices rows flattened with their event/market/runner so exported
+# files can be queried as one wide table (e.g. DuckDB read_parquet)
+COLD_PRICES_SQL = """
+SELECT p.id, p.fetched_at, e.game_pk, m.market_key, m.market_category, r.runner_name,
+       p.selection_id, p.in_play, p.american_odds, p.decimal_odds, p.line,
+       (p.fetched_at AT TIME ZONE 'UTC')::date AS fetched_date
+FROM fd_prices p
+JOIN fd_markets m ON m.id = p.market_id
+JOIN fd_events e ON e.id = m.event_id
+LEFT JOIN fd_runners r ON r.id = p.runner_id
+WHERE p.fetched_at < now() - make_interval(days => :cutoff_days)
+ORDER BY p.fetched_at
+"""
+
+def export_cold_prices_to_parquet(engine, out_dir, cutoff_days=7, chunksize=100_000):
+    # Writes out_dir/fetched_date=YYYY-MM-DD/part-NNNNN.parquet
+    return _export_to_parquet(engine, COLD_PRICES_SQL, {'cutoff_days': cutoff_days},
+                              out_dir, 'fetched_date', chunksize)
+
+# Hot analytical pitch columns, projected out of the wide statcast_pitches
+# rows; the row table stays authoritative
+STATCAST_PROJECTION_SQL = """
+SELECT p.game_pk, p.pitcher_id, p.batter_id, p.pitch_type, p.release_speed, p.release_spin_rate,
+       p.pfx_x, p.pfx_z, p.plate_x, p.plate_z, p.zone, p.season
+FROM statcast_pitches p
+WHERE p.season = :season
+ORDER BY p.game_pk
+"""
+
+def export_statcast_pitches_to_parquet(engine, out_dir, season, chunksize=250_000):
+    # Rebuilds out_dir/season=YYYY/ for one season, e.g. after a day's loads;
+    # query with DuckDB over read_parquet('out_dir/*/*.parquet')
+    return _export_to_parquet(engine, STATCAST_PROJECTION_SQL, {'season': int(season)},
+                              out_dir, 'season', chunksize)
+
+def export_season_stats_to_parquet(engine, out_dir, season, chunksize=50_000):
+    # Freezes a finished season as out_dir/<table>/season=YYYY/ for each
+    # season stats table; multi-season leaderboards can then run in DuckDB
+    # over read_parquet('out_dir/player_season_stats/*/*.parquet', hive_partitioning=true)
+    return sum(
+        _export_to_parquet(engine, f"SELECT * FROM {table} WHERE season = :season", {'season': int(season)},
+                           os.path.join(out_dir, table), 'season', chunksize)
+        for table in SEASON_PARTITIONED_TABLES
+    )
+
+# Season-partitioned tables (PARTITION BY RANGE (season)) and the first
+# season given its own partition. There is no DEFAULT partition: a load
+# for a season without one fails instead of parking rows where they would
+# block that season's partition from ever being added
+SEASON_PARTITIONED_TABLES = ('player_season_stats', 'team_season_stats')
+FIRST_PARTITIONED_SEASON = 2015
+
+# Databases created before the tables were partitioned keep plain tables,
+# which create_season_partitions leaves alone. To convert one, per table:
+#   ALTER TABLE player_season_stats RENAME TO player_season_stats_old;
+#   (rename its indexes too, or drop them, so the names are free)
+#   create_season_tables(engine)
+#   INSERT INTO player_season_stats (<all non-generated columns>)
+#       SELECT <same columns> FROM player_season_stats_old;
+#   DROP TABLE player_season_stats_old;
+
+def create_season_partitions(engine, seasons=None):
+    # Idempotent; by default covers every season through next year, so
+    # run it (or create_season_tables) once a year before opening day
+    if seasons is None:
+        seasons = range(FIRST_PARTITIONED_SEASON, datetime.now(timezone.utc).year + 2)
+    with engine.begin() as conn:
+        partitioned = set(conn.execute(text(
+            "SELECT c.relname FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = ANY(:tables)"
+        ), {'tables': list(SEASON_PARTITIONED_TABLES)}).scalars())
+        for table in SEASON_PARTITIONED_TABLES:
+            if table not in partitioned:
+                print(f"{table} is not partitioned; skipping season partitions")
+                continue
+            for season in seasons:
+                conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {table}_{int(season)} PARTITION OF {table} "
+                    f"FOR VALUES FROM ({int(season)}) TO ({int(season) + 1})"
+                ))
+
 def create_all_betting_tables(engine):
     BettingBase.metadata.create_all(engine)
     print("Created all betting tables successfully")
 
 def create_season_tables(engine):
     SeasonBase.metadata.create_all(engine)
+    create_season_partitions(engine)
     print("Created season statistics tables successfully")
 
 if __name__ == "__main__":
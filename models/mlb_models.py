@@ -1,28 +1,53 @@
-from sqlalchemy import Column, Integer, String, DateTime, Date, Boolean, Text, Float, Numeric, Index
+from sqlalchemy import MetaData, Column, Integer, SmallInteger, BigInteger, String, Uuid, DateTime, Date, Boolean, Text, Float, REAL, Numeric, Index, PrimaryKeyConstraint, UniqueConstraint, CheckConstraint, Enum, func
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+import uuid
 from datetime import datetime
 
-Base = declarative_base()
+# Spell out PostgreSQL's own names for unnamed keys and constraints so the
+# Python side can refer to them (e.g. GAME_CLUSTER_INDEXES) and they stay
+# put if a table is created some other way
+NAMING_CONVENTION = {
+    'ix': 'ix_%(column_0_label)s',
+    'uq': '%(table_name)s_%(column_0_N_name)s_key',
+    'fk': '%(table_name)s_%(column_0_N_name)s_fkey',
+    'pk': '%(table_name)s_pkey'
+}
+
+Base = declarative_base(metadata=MetaData(naming_convention=NAMING_CONVENTION))
+
+# Two-value vocabularies written only by our own processors; shared native
+# enum types instead of VARCHAR
+INNING_HALF = Enum('top', 'bottom', name='inning_half_enum', metadata=Base.metadata)
+TEAM_TYPE = Enum('home', 'away', name='team_type_enum', metadata=Base.metadata)
+
+def uuid_key(value):
+    """Return an upstream id as a UUID string for the native UUID key columns;
+    ids that aren't UUIDs (our fallbacks) map to a stable uuid5 of the text"""
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, str(value)))
 
 class Game(Base):
     __tablename__ = 'games'
     
     # Primary identifiers
     game_pk = Column(Integer, primary_key=True)
-    game_guid = Column(String(50), unique=True)
+    game_guid = Column(Uuid(as_uuid=False), unique=True)
     link = Column(String(100))
     
     # Game details
     game_type = Column(String(10))  # R for regular, P for playoffs, etc
-    season = Column(String(4))
+    season = Column(String(4), index=True)
     game_date = Column(DateTime)
-    official_date = Column(Date)
+    official_date = Column(Date, index=True)
     
     # Teams
-    home_team_id = Column(Integer)
+    home_team_id = Column(Integer, index=True)
     home_team_name = Column(String(100))
     home_team_abbreviation = Column(String(10))
-    away_team_id = Column(Integer)
+    away_team_id = Column(Integer, index=True)
     away_team_name = Column(String(100))
     away_team_abbreviation = Column(String(10))
     
@@ -56,27 +81,58 @@ class Game(Base):
     away_errors = Column(Integer)
     
     # Metadata
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    # Per-game child rows. There are no database foreign keys (children are
+    # loaded independently), so these are view-only. The pitch-level
+    # collections raise rather than lazy load one game at a time; use
+    # load_games() or selectinload() for those
+    line_scores = relationship(
+        'GameLineScore', primaryjoin='Game.game_pk == foreign(GameLineScore.game_pk)',
+        viewonly=True, back_populates='game'
+    )
+    box_scores = relationship(
+        'BoxScore', primaryjoin='Game.game_pk == foreign(BoxScore.game_pk)',
+        viewonly=True, back_populates='game'
+    )
+    wpa = relationship(
+        'GameWPA', primaryjoin='Game.game_pk == foreign(GameWPA.game_pk)',
+        viewonly=True, back_populates='game', lazy='raise'
+    )
+    pitches = relationship(
+        'StatcastPitch', primaryjoin='Game.game_pk == foreign(StatcastPitch.game_pk)',
+        viewonly=True, back_populates='game', lazy='raise'
+    )
+    batted_balls = relationship(
+        'BattedBall', primaryjoin='Game.game_pk == foreign(BattedBall.game_pk)',
+        viewonly=True, back_populates='game', lazy='raise'
+    )
 
 class StatcastPitch(Base):
     __tablename__ = 'statcast_pitches'
     
     # Primary key
-    pitch_id = Column(String(50), primary_key=True)
-    game_pk = Column(Integer, index=True)
+    pitch_id = Column(Uuid(as_uuid=False), primary_key=True)  # Statcast play_id
+    game_pk = Column(Integer, nullable=False)
+    
+    # Copied from the game so season / team filters skip the games join
+    season = Column(SmallInteger, nullable=False)
+    game_date = Column(Date, nullable=False)
+    pitcher_team_id = Column(Integer)
+    batter_team_id = Column(Integer)
     
     # Pitch identifiers
     ab_number = Column(Integer)
     pitch_number = Column(Integer)
     
     # Players
-    pitcher_id = Column(Integer)
-    batter_id = Column(Integer)
+    pitcher_id = Column(Integer, nullable=False)
+    batter_id = Column(Integer, nullable=False)
     
     # Game state
     inning = Column(Integer)
-    inning_half = Column(String(10))
+    inning_half = Column(INNING_HALF)
     balls = Column(Integer)
     strikes = Column(Integer)
     outs = Column(Integer)
@@ -84,70 +140,112 @@ class StatcastPitch(Base):
     # Pitch characteristics
     pitch_type = Column(String(10))
     pitch_name = Column(String(50))
-    release_speed = Column(Float)
-    release_pos_x = Column(Float)
-    release_pos_z = Column(Float)
-    release_extension = Column(Float)
+    release_speed = Column(REAL)
+    release_pos_x = Column(REAL)
+    release_pos_z = Column(REAL)
+    release_extension = Column(REAL)
     
     # Pitch movement
-    pfx_x = Column(Float)
-    pfx_z = Column(Float)
-    plate_x = Column(Float)
-    plate_z = Column(Float)
-    vx0 = Column(Float)
-    vy0 = Column(Float)
-    vz0 = Column(Float)
-    ax = Column(Float)
-    ay = Column(Float)
-    az = Column(Float)
+    pfx_x = Column(REAL)
+    pfx_z = Column(REAL)
+    plate_x = Column(REAL)
+    plate_z = Column(REAL)
+    vx0 = Column(REAL)
+    vy0 = Column(REAL)
+    vz0 = Column(REAL)
+    ax = Column(REAL)
+    ay = Column(REAL)
+    az = Column(REAL)
     
     # Spin data
-    release_spin_rate = Column(Float)
-    spin_axis = Column(Float)
+    release_spin_rate = Column(REAL)
+    spin_axis = Column(REAL)
     
     # Result
     pitch_result = Column(String(50))
     play_result = Column(String(100))
     
     # Strike zone
-    zone = Column(Integer)
+    zone = Column(SmallInteger)
     
     # Timestamps
-    created_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    game = relationship(
+        'Game', primaryjoin='foreign(StatcastPitch.game_pk) == Game.game_pk',
+        viewonly=True, back_populates='pitches'
+    )
+    
+    # Loaded in bulk (Core inserts / copy_rows); skip the post-insert fetch of
+    # created_at and the rowcount check on deletes
+    __mapper_args__ = {'eager_defaults': False, 'confirm_deleted_rows': False}
+    
+    __table_args__ = (
+        Index("ix_statcast_pitch_game_inning", "game_pk", "inning", "inning_half"),
+        Index("ix_statcast_pitch_batter_game", "batter_id", "game_pk"),
+        Index("ix_statcast_pitch_pitcher_game", "pitcher_id", "game_pk"),
+        Index("ix_statcast_pitch_season_pitcher_team", "season", "pitcher_team_id"),
+        Index("ix_statcast_pitch_season_batter_team", "season", "batter_team_id"),
+        CheckConstraint("balls BETWEEN 0 AND 4", name="ck_statcast_pitch_balls"),
+        CheckConstraint("strikes BETWEEN 0 AND 3", name="ck_statcast_pitch_strikes"),
+        CheckConstraint("outs BETWEEN 0 AND 3", name="ck_statcast_pitch_outs"),
+        CheckConstraint("inning >= 1", name="ck_statcast_pitch_inning"),
+    )
 
 class BattedBall(Base):
     __tablename__ = 'batted_balls'
     
     # Primary key
-    play_id = Column(String(50), primary_key=True)
-    game_pk = Column(Integer, index=True)
+    play_id = Column(Uuid(as_uuid=False), primary_key=True)  # Same id as its pitch
+    game_pk = Column(Integer, nullable=False)
+    
+    # Copied from the game so season / team filters skip the games join
+    season = Column(SmallInteger, nullable=False)
+    game_date = Column(Date, nullable=False)
+    pitcher_team_id = Column(Integer)
+    batter_team_id = Column(Integer)
     
     # Players
-    batter_id = Column(Integer)
-    pitcher_id = Column(Integer)
+    batter_id = Column(Integer, nullable=False)
+    pitcher_id = Column(Integer, nullable=False)
     
     # Game state
     inning = Column(Integer)
-    inning_half = Column(String(10))
+    inning_half = Column(INNING_HALF)
     
     # Batted ball data
-    exit_velocity = Column(Float)
-    launch_angle = Column(Float)
-    launch_speed = Column(Float)
-    launch_direction = Column(Float)
-    hit_distance = Column(Float)
-    hang_time = Column(Float)
+    exit_velocity = Column(REAL)
+    launch_angle = Column(REAL)
+    launch_speed = Column(REAL)
+    launch_direction = Column(REAL)
+    hit_distance = Column(REAL)
+    hang_time = Column(REAL)
     
     # Coordinates
-    hit_coord_x = Column(Float)
-    hit_coord_y = Column(Float)
+    hit_coord_x = Column(REAL)
+    hit_coord_y = Column(REAL)
     
     # Result
     bb_type = Column(String(50))
     result = Column(String(100))
     
     # Created timestamp
-    created_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    game = relationship(
+        'Game', primaryjoin='foreign(BattedBall.game_pk) == Game.game_pk',
+        viewonly=True, back_populates='batted_balls'
+    )
+    
+    __mapper_args__ = {'eager_defaults': False, 'confirm_deleted_rows': False}
+    
+    __table_args__ = (
+        Index("ix_batted_ball_game_inning", "game_pk", "inning", "inning_half"),
+        Index("ix_batted_ball_batter_game", "batter_id", "game_pk"),
+        Index("ix_batted_ball_pitcher_game", "pitcher_id", "game_pk"),
+        Index("ix_batted_ball_season_batter_team", "season", "batter_team_id"),
+        Index("ix_batted_ball_season_pitcher_team", "season", "pitcher_team_id"),
+    )
 
 class GameLineScore(Base):
     __tablename__ = 'game_line_scores'
@@ -155,27 +253,34 @@ class GameLineScore(Base):
     # Composite primary key
     game_pk = Column(Integer, primary_key=True)
     inning = Column(Integer, primary_key=True)
-    team_type = Column(String(10), primary_key=True)  # 'home' or 'away'
+    team_type = Column(TEAM_TYPE, primary_key=True)
     
     # Inning stats
-    runs = Column(Integer)
-    hits = Column(Integer)
-    errors = Column(Integer)
-    left_on_base = Column(Integer)
+    runs = Column(Integer, nullable=False, server_default='0')
+    hits = Column(Integer, nullable=False, server_default='0')
+    errors = Column(Integer, nullable=False, server_default='0')
+    left_on_base = Column(Integer, nullable=False, server_default='0')
     
     # Timestamps
-    created_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    game = relationship(
+        'Game', primaryjoin='foreign(GameLineScore.game_pk) == Game.game_pk',
+        viewonly=True, back_populates='line_scores'
+    )
+    
+    __mapper_args__ = {'eager_defaults': False, 'confirm_deleted_rows': False}
 
 class GameWPA(Base):
     __tablename__ = 'game_wpa'
     
     # Primary key
-    play_id = Column(String(50), primary_key=True)
-    game_pk = Column(Integer, index=True)
+    play_id = Column(BigInteger, primary_key=True)  # game_pk * 1000 + atBatIndex
+    game_pk = Column(Integer, nullable=False, index=True)
     
     # Play details
     inning = Column(Integer)
-    inning_half = Column(String(10))
+    inning_half = Column(INNING_HALF)
     
     # WPA data
     home_win_exp = Column(Float)
@@ -187,7 +292,14 @@ class GameWPA(Base):
     pitcher_id = Column(Integer)
     
     # Created timestamp
-    created_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    game = relationship(
+        'Game', primaryjoin='foreign(GameWPA.game_pk) == Game.game_pk',
+        viewonly=True, back_populates='wpa'
+    )
+    
+    __mapper_args__ = {'eager_defaults': False, 'confirm_deleted_rows': False}
 
 class BoxScore(Base):
     __tablename__ = 'box_scores'
@@ -195,7 +307,7 @@ class BoxScore(Base):
     # Composite primary key
     game_pk = Column(Integer, primary_key=True)
     player_id = Column(Integer, primary_key=True)
-    team_type = Column(String(10), primary_key=True)  # 'home' or 'away'
+    team_type = Column(TEAM_TYPE, primary_key=True)
     
     # Player info
     player_name = Column(String(100))
@@ -203,25 +315,36 @@ class BoxScore(Base):
     batting_order = Column(Integer)
     
     # Batting stats
-    at_bats = Column(Integer)
-    runs = Column(Integer)
-    hits = Column(Integer)
-    rbi = Column(Integer)
-    walks = Column(Integer)
-    strikeouts = Column(Integer)
-    doubles = Column(Integer)
-    triples = Column(Integer)
-    home_runs = Column(Integer)
-    
-    # Pitching stats (if applicable)
-    innings_pitched = Column(Float)
-    earned_runs = Column(Integer)
-    pitcher_hits = Column(Integer)
-    pitcher_walks = Column(Integer)
-    pitcher_strikeouts = Column(Integer)
+    at_bats = Column(SmallInteger, nullable=False, server_default='0')
+    runs = Column(SmallInteger, nullable=False, server_default='0')
+    hits = Column(SmallInteger, nullable=False, server_default='0')
+    rbi = Column(SmallInteger, nullable=False, server_default='0')
+    walks = Column(SmallInteger, nullable=False, server_default='0')
+    strikeouts = Column(SmallInteger, nullable=False, server_default='0')
+    doubles = Column(SmallInteger, nullable=False, server_default='0')
+    triples = Column(SmallInteger, nullable=False, server_default='0')
+    home_runs = Column(SmallInteger, nullable=False, server_default='0')
+    
+    # Pitching stats (if applicable); NULL means the player didn't pitch
+    innings_pitched = Column(REAL)
+    earned_runs = Column(SmallInteger)
+    pitcher_hits = Column(SmallInteger)
+    pitcher_walks = Column(SmallInteger)
+    pitcher_strikeouts = Column(SmallInteger)
     
     # Timestamps
-    created_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    game = relationship(
+        'Game', primaryjoin='foreign(BoxScore.game_pk) == Game.game_pk',
+        viewonly=True, back_populates='box_scores'
+    )
+    
+    __mapper_args__ = {'eager_defaults': False, 'confirm_deleted_rows': False}
+    
+    __table_args__ = (
+        Index("ix_box_score_player_game", "player_id", "game_pk"),
+    )
 
 
 class Player(Base):
@@ -235,20 +358,9 @@ class Player(Base):
     first_name = Column(String(50))
     last_name = Column(String(50))
     
-    # Physical info
-    height = Column(String(20))
-    weight = Column(Integer)
-    birth_date = Column(Date)
-    
     # Career info
-    mlb_debut_date = Column(Date)
     active = Column(Boolean)
     
-    # Birth location
-    birth_city = Column(String(100))
-    birth_country = Column(String(100))
-    birth_state_province = Column(String(100))
-    
     # Position info
     primary_position_name = Column(String(50))
     primary_position_code = Column(String(10))
@@ -264,8 +376,42 @@ class Player(Base):
     current_team_id = Column(Integer)
     
     # Timestamps
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    # Biography lives in player_bio so the row joined on every lookup stays narrow
+    bio = relationship(
+        'PlayerBio', primaryjoin='Player.mlb_id == foreign(PlayerBio.mlb_id)',
+        viewonly=True, uselist=False, lazy='raise', back_populates='player'
+    )
+
+class PlayerBio(Base):
+    __tablename__ = 'player_bio'
+    
+    # Primary key (same id as players)
+    mlb_id = Column(Integer, primary_key=True)
+    
+    # Physical info
+    height = Column(String(20))
+    weight = Column(Integer)
+    birth_date = Column(Date)
+    
+    # Career info
+    mlb_debut_date = Column(Date)
+    
+    # Birth location
+    birth_city = Column(String(100))
+    birth_country = Column(String(100))
+    birth_state_province = Column(String(100))
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    player = relationship(
+        'Player', primaryjoin='foreign(PlayerBio.mlb_id) == Player.mlb_id',
+        viewonly=True, back_populates='bio'
+    )
 
 class Venue(Base):
     __tablename__ = 'venues'
@@ -277,8 +423,8 @@ class Venue(Base):
     name = Column(String(100))
     
     # Timestamps
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 class Team(Base):
     __tablename__ = 'teams'
@@ -303,17 +449,14 @@ class Team(Base):
     active = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
 class StatcastBatterAggregates(Base):
     __tablename__ = 'statcast_batter_aggregates'
     
-    # Primary key
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    
-    # Foreign key
+    # Composite primary key (declared below)
     player_id = Column(Integer)  # Links to Player.mlb_id
     season = Column(Integer)
     
@@ -341,28 +484,32 @@ class StatcastBatterAggregates(Base):
     
     # Sample size
     attempts = Column(Integer)
+    
+    # The primary key index carries the headline contact metrics, so
+    # leaderboard reads are index-only scans without a second B-tree
+    __table_args__ = (
+        PrimaryKeyConstraint("player_id", "season",
+                             postgresql_include=["avg_hit_speed", "max_hit_speed", "barrel_batted_rate", "hard_hit_percent"]),
+    )
 
 class BatterPitchPerformance(Base):
     __tablename__ = 'batter_pitch_performance'
     
-    # Primary key
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    
-    # Foreign key
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    season = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    season = Column(Integer, primary_key=True)
     
     # Pitch type and performance
-    pitch_type = Column(String(10))
+    pitch_type = Column(String(10), primary_key=True)
     pa = Column(Integer)  # Plate appearances
     whiff_percent = Column(Float)
 
 class BatterExitVelocityBarrels(Base):
     __tablename__ = 'batter_exitvelo_barrels'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
     
     # Player info
     player_name = Column(String(100))
@@ -376,13 +523,13 @@ class BatterExitVelocityBarrels(Base):
     max_hit_speed = Column(Float)
     avg_hit_speed = Column(Float)
     ev50 = Column(Float)
-    ev95plus = Column(Integer)
+    ev95plus = Column(SmallInteger)
     ev95percent = Column(Float)
     
     # Distance metrics
-    max_distance = Column(Integer)
-    avg_distance = Column(Integer)
-    avg_hr_distance = Column(Integer)
+    max_distance = Column(SmallInteger)
+    avg_distance = Column(SmallInteger)
+    avg_hr_distance = Column(SmallInteger)
     
     # Ball type percentages
     fbld = Column(Float)
@@ -396,9 +543,9 @@ class BatterExitVelocityBarrels(Base):
 class BatterExpectedStats(Base):
     __tablename__ = 'batter_expected_stats'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
     
     # Player info
     player_name = Column(String(100))
@@ -425,52 +572,52 @@ class BatterExpectedStats(Base):
 class BatterPercentileRanks(Base):
     __tablename__ = 'batter_percentile_ranks'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
     
     # Player info
     player_name = Column(String(100))
     
     # Expected stats percentiles
-    xwoba = Column(Float)
-    xba = Column(Float)
-    xslg = Column(Float)
-    xiso = Column(Float)
-    xobp = Column(Float)
+    xwoba = Column(REAL)
+    xba = Column(REAL)
+    xslg = Column(REAL)
+    xiso = Column(REAL)
+    xobp = Column(REAL)
     
     # Barrel/exit velocity percentiles
-    brl = Column(Float)
-    brl_percent = Column(Float)
-    exit_velocity = Column(Float)
-    max_ev = Column(Float)
-    hard_hit_percent = Column(Float)
+    brl = Column(REAL)
+    brl_percent = Column(REAL)
+    exit_velocity = Column(REAL)
+    max_ev = Column(REAL)
+    hard_hit_percent = Column(REAL)
     
     # Plate discipline percentiles
-    k_percent = Column(Float)
-    bb_percent = Column(Float)
-    whiff_percent = Column(Float)
-    chase_percent = Column(Float)
+    k_percent = Column(REAL)
+    bb_percent = Column(REAL)
+    whiff_percent = Column(REAL)
+    chase_percent = Column(REAL)
     
     # Physical/athletic percentiles
-    arm_strength = Column(Float)
-    sprint_speed = Column(Float)
+    arm_strength = Column(REAL)
+    sprint_speed = Column(REAL)
     
     # Fielding percentile
-    oaa = Column(Float)
+    oaa = Column(REAL)
     
     # Bat tracking percentiles
-    bat_speed = Column(Float)
-    squared_up_rate = Column(Float)
-    swing_length = Column(Float)
+    bat_speed = Column(REAL)
+    squared_up_rate = Column(REAL)
+    swing_length = Column(REAL)
 
 class BatterPitchArsenal(Base):
     __tablename__ = 'batter_pitch_arsenal'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
-    pitch_type = Column(String(10))
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
+    pitch_type = Column(String(10), primary_key=True)
     
     # Player info
     player_name = Column(String(100))
@@ -502,13 +649,12 @@ class BatterPitchArsenal(Base):
     put_away = Column(Float)
     hard_hit_percent = Column(Float)
 
-
 class PitcherExitVelocityBarrels(Base):
     __tablename__ = 'pitcher_exitvelo_barrels'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
     
     # Player info
     player_name = Column(String(100))
@@ -522,13 +668,13 @@ class PitcherExitVelocityBarrels(Base):
     max_hit_speed = Column(Float)
     avg_hit_speed = Column(Float)
     ev50 = Column(Float)
-    ev95plus = Column(Integer)
+    ev95plus = Column(SmallInteger)
     ev95percent = Column(Float)
     
     # Distance metrics allowed
-    max_distance = Column(Integer)
-    avg_distance = Column(Integer)
-    avg_hr_distance = Column(Integer)
+    max_distance = Column(SmallInteger)
+    avg_distance = Column(SmallInteger)
+    avg_hr_distance = Column(SmallInteger)
     
     # Ball type percentages allowed
     fbld = Column(Float)
@@ -542,9 +688,9 @@ class PitcherExitVelocityBarrels(Base):
 class PitcherExpectedStats(Base):
     __tablename__ = 'pitcher_expected_stats'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
     
     # Player info
     player_name = Column(String(100))
@@ -576,71 +722,82 @@ class PitcherExpectedStats(Base):
 class PitcherPercentileRanks(Base):
     __tablename__ = 'pitcher_percentile_ranks'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
     
     # Player info
     player_name = Column(String(100))
     
     # Expected stats percentiles
-    xwoba = Column(Float)
-    xba = Column(Float)
-    xslg = Column(Float)
-    xiso = Column(Float)
-    xobp = Column(Float)
-    xera = Column(Float)
+    xwoba = Column(REAL)
+    xba = Column(REAL)
+    xslg = Column(REAL)
+    xiso = Column(REAL)
+    xobp = Column(REAL)
+    xera = Column(REAL)
     
     # Barrel/exit velocity percentiles (against)
-    brl = Column(Float)
-    brl_percent = Column(Float)
-    exit_velocity = Column(Float)
-    max_ev = Column(Float)
-    hard_hit_percent = Column(Float)
+    brl = Column(REAL)
+    brl_percent = Column(REAL)
+    exit_velocity = Column(REAL)
+    max_ev = Column(REAL)
+    hard_hit_percent = Column(REAL)
     
     # Plate discipline percentiles
-    k_percent = Column(Float)
-    bb_percent = Column(Float)
-    whiff_percent = Column(Float)
-    chase_percent = Column(Float)
+    k_percent = Column(REAL)
+    bb_percent = Column(REAL)
+    whiff_percent = Column(REAL)
+    chase_percent = Column(REAL)
     
     # Physical percentiles
-    arm_strength = Column(Float)
+    arm_strength = Column(REAL)
     
     # Pitch quality percentiles
-    fb_velocity = Column(Float)
-    fb_spin = Column(Float)
-    curve_spin = Column(Float)
+    fb_velocity = Column(REAL)
+    fb_spin = Column(REAL)
+    curve_spin = Column(REAL)
+
+# Savant's pitch-usage columns (arsenal_type="n_") and the pitch type each
+# one is melted into on load
+ARSENAL_USAGE_PITCH_TYPES = {
+    'n_ff': 'FF',  # Four-seam fastball
+    'n_si': 'SI',  # Sinker
+    'n_fc': 'FC',  # Cutter
+    'n_sl': 'SL',  # Slider
+    'n_ch': 'CH',  # Changeup
+    'n_cu': 'CU',  # Curveball
+    'n_fs': 'FS',  # Splitter
+    'n_kn': 'KN',  # Knuckleball
+    'n_st': 'ST',  # Sweeper
+    'n_sv': 'SV'   # Slurve
+}
 
-class PitcherPitchArsenalUsage(Base):
-    __tablename__ = 'pitcher_pitch_arsenal_usage'
+class PitcherPitchUsage(Base):
+    __tablename__ = 'pitcher_pitch_usage'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
+    pitch_type = Column(String(10), primary_key=True)
     
     # Player info
     player_name = Column(String(100))
     
-    # Pitch usage percentages
-    n_ff = Column(Float)  # Four-seam fastball usage %
-    n_si = Column(Float)  # Sinker usage %
-    n_fc = Column(Float)  # Cutter usage %
-    n_sl = Column(Float)  # Slider usage %
-    n_ch = Column(Float)  # Changeup usage %
-    n_cu = Column(Float)  # Curveball usage %
-    n_fs = Column(Float)  # Splitter usage %
-    n_kn = Column(Float)  # Knuckleball usage %
-    n_st = Column(Float)  # Sweeper usage %
-    n_sv = Column(Float)  # Slurve usage %
+    # Usage %
+    pitch_usage = Column(REAL)
+    
+    __table_args__ = (
+        Index("ix_pitcher_pitch_usage_type", "pitch_type", "pitch_usage"),
+    )
 
 class PitcherArsenalStats(Base):
     __tablename__ = 'pitcher_arsenal_stats'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
-    pitch_type = Column(String(10))
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
+    pitch_type = Column(String(10), primary_key=True)
     
     # Player info
     player_name = Column(String(100))
@@ -675,7 +832,7 @@ class PitcherArsenalStats(Base):
 class PitcherPitchMovement(Base):
     __tablename__ = 'pitcher_pitch_movement'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Composite primary key (declared below)
     player_id = Column(Integer)  # Links to Player.mlb_id
     year = Column(Integer)
     pitch_type = Column(String(10))
@@ -684,31 +841,36 @@ class PitcherPitchMovement(Base):
     player_name = Column(String(100))
     
     # Movement metrics
-    avg_speed = Column(Float)
-    avg_spin = Column(Float)
-    pfx_x = Column(Float)  # Horizontal movement
-    pfx_z = Column(Float)  # Vertical movement
-    break_x = Column(Float)
-    break_z = Column(Float)
+    avg_speed = Column(REAL)
+    avg_spin = Column(REAL)
+    pfx_x = Column(REAL)  # Horizontal movement
+    pfx_z = Column(REAL)  # Vertical movement
+    break_x = Column(REAL)
+    break_z = Column(REAL)
     
     # Usage
     pitches = Column(Integer)
+    
+    __table_args__ = (
+        PrimaryKeyConstraint("player_id", "year", "pitch_type",
+                             postgresql_include=["avg_speed", "avg_spin", "pfx_x", "pfx_z"]),
+    )
 
 class PitcherActiveSpin(Base):
     __tablename__ = 'pitcher_active_spin'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    player_id = Column(Integer)  # Links to Player.mlb_id
-    year = Column(Integer)
+    # Composite primary key
+    player_id = Column(Integer, primary_key=True)  # Links to Player.mlb_id
+    year = Column(Integer, primary_key=True)
     
     # Player info
     player_name = Column(String(100))
     
     # Active spin metrics
     pitches = Column(Integer)
-    active_spin_avg = Column(Float)
-    spin_rate_avg = Column(Float)
-    active_spin_pct = Column(Float)
+    active_spin_avg = Column(REAL)
+    spin_rate_avg = Column(REAL)
+    active_spin_pct = Column(REAL)
 
 class PitcherSpinDirectionComparison(Base):
     __tablename__ = 'pitcher_spin_dir_comp'
@@ -755,6 +917,10 @@ class PitcherSpinDirectionComparison(Base):
     diff_clock_label = Column(String(50))
     diff_measured_hours = Column(Float)
     diff_inferred_hours = Column(Float)
+    
+    __table_args__ = (
+        Index("ix_pitcher_spin_dir_player_year", "player_id", "year"),
+    )
 
 class PlayerSplits(Base):
     __tablename__ = 'player_splits'
@@ -772,35 +938,43 @@ class PlayerSplits(Base):
     split_value = Column(String(50), nullable=False)     # Human readable split name
     
     # Basic batting stats
-    games = Column(Integer)
-    games_started = Column(Integer) 
-    plate_appearances = Column(Integer)
-    at_bats = Column(Integer)
-    runs = Column(Integer)
-    hits = Column(Integer)
-    doubles = Column(Integer)
-    triples = Column(Integer)
-    home_runs = Column(Integer)
-    rbi = Column(Integer)
-    walks = Column(Integer)
-    strikeouts = Column(Integer)
-    stolen_bases = Column(Integer)
-    caught_stealing = Column(Integer)
-    sacrifice_bunts = Column(Integer)
-    sacrifice_flies = Column(Integer)
-    hit_by_pitch = Column(Integer)
+    games = Column(SmallInteger)
+    games_started = Column(SmallInteger) 
+    plate_appearances = Column(SmallInteger)
+    at_bats = Column(SmallInteger)
+    runs = Column(SmallInteger)
+    hits = Column(SmallInteger)
+    doubles = Column(SmallInteger)
+    triples = Column(SmallInteger)
+    home_runs = Column(SmallInteger)
+    rbi = Column(SmallInteger)
+    walks = Column(SmallInteger)
+    strikeouts = Column(SmallInteger)
+    stolen_bases = Column(SmallInteger)
+    caught_stealing = Column(SmallInteger)
+    sacrifice_bunts = Column(SmallInteger)
+    sacrifice_flies = Column(SmallInteger)
+    hit_by_pitch = Column(SmallInteger)
     
     # Advanced batting stats
-    batting_average = Column(Float)
-    on_base_percentage = Column(Float)
-    slugging_percentage = Column(Float)
-    ops = Column(Float)
-    babip = Column(Float)
-    iso = Column(Float)
+    batting_average = Column(REAL)
+    on_base_percentage = Column(REAL)
+    slugging_percentage = Column(REAL)
+    ops = Column(REAL)
+    babip = Column(REAL)
+    iso = Column(REAL)
     
     # Timestamps
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    # Written through INSERT ... ON CONFLICT upserts; no RETURNING of the
+    # server-side timestamps or delete rowcount checks on ORM flushes
+    __mapper_args__ = {'eager_defaults': False, 'confirm_deleted_rows': False}
+    
+    __table_args__ = (
+        UniqueConstraint("player_id", "season", "split_type", name="uq_player_split"),
+    )
 
 class PitcherSplits(Base):
     __tablename__ = 'pitcher_splits'
@@ -818,61 +992,67 @@ class PitcherSplits(Base):
     split_value = Column(String(50), nullable=False)     # Human readable split name
     
     # Opponent batting stats (what batters did against this pitcher)
-    opponent_plate_appearances = Column(Integer)
-    opponent_at_bats = Column(Integer)
-    opponent_runs = Column(Integer)
-    opponent_hits = Column(Integer)
-    opponent_doubles = Column(Integer)
-    opponent_triples = Column(Integer)
-    opponent_home_runs = Column(Integer)
-    opponent_stolen_bases = Column(Integer)
-    opponent_caught_stealing = Column(Integer)
-    opponent_walks = Column(Integer)
-    opponent_strikeouts = Column(Integer)
-    opponent_batting_average = Column(Float)
-    opponent_on_base_percentage = Column(Float)
-    opponent_slugging_percentage = Column(Float)
-    opponent_ops = Column(Float)
-    opponent_total_bases = Column(Integer)
-    opponent_ground_into_double_play = Column(Integer)
-    opponent_sacrifice_flies = Column(Integer)
-    opponent_sacrifice_hits = Column(Integer)
-    opponent_reached_on_error = Column(Integer)
-    opponent_babip = Column(Float)
-    opponent_t_ops_plus = Column(Float)
-    opponent_s_ops_plus = Column(Float)
-    opponent_so_per_walk = Column(Float)
+    opponent_plate_appearances = Column(SmallInteger)
+    opponent_at_bats = Column(SmallInteger)
+    opponent_runs = Column(SmallInteger)
+    opponent_hits = Column(SmallInteger)
+    opponent_doubles = Column(SmallInteger)
+    opponent_triples = Column(SmallInteger)
+    opponent_home_runs = Column(SmallInteger)
+    opponent_stolen_bases = Column(SmallInteger)
+    opponent_caught_stealing = Column(SmallInteger)
+    opponent_walks = Column(SmallInteger)
+    opponent_strikeouts = Column(SmallInteger)
+    opponent_batting_average = Column(REAL)
+    opponent_on_base_percentage = Column(REAL)
+    opponent_slugging_percentage = Column(REAL)
+    opponent_ops = Column(REAL)
+    opponent_total_bases = Column(SmallInteger)
+    opponent_ground_into_double_play = Column(SmallInteger)
+    opponent_sacrifice_flies = Column(SmallInteger)
+    opponent_sacrifice_hits = Column(SmallInteger)
+    opponent_reached_on_error = Column(SmallInteger)
+    opponent_babip = Column(REAL)
+    opponent_t_ops_plus = Column(REAL)
+    opponent_s_ops_plus = Column(REAL)
+    opponent_so_per_walk = Column(REAL)
     
     # Pitcher performance stats
-    wins = Column(Integer)
-    losses = Column(Integer)
-    win_percentage = Column(Float)
-    era = Column(Float)
-    games = Column(Integer)
-    games_started = Column(Integer)
-    games_finished = Column(Integer)
-    complete_games = Column(Integer)
-    shutouts = Column(Integer)
-    saves = Column(Integer)
-    innings_pitched = Column(Float)
-    hits_allowed = Column(Integer)
-    runs_allowed = Column(Integer)
-    earned_runs = Column(Integer)
-    home_runs_allowed = Column(Integer)
-    walks_allowed = Column(Integer)
-    intentional_walks_allowed = Column(Integer)
-    strikeouts_pitched = Column(Integer)
-    hit_batters = Column(Integer)
-    balks = Column(Integer)
-    wild_pitches = Column(Integer)
-    batters_faced = Column(Integer)
-    whip = Column(Float)
-    strikeouts_per_nine = Column(Float)
-    strikeouts_per_walk = Column(Float)
+    wins = Column(SmallInteger)
+    losses = Column(SmallInteger)
+    win_percentage = Column(REAL)
+    era = Column(REAL)
+    games = Column(SmallInteger)
+    games_started = Column(SmallInteger)
+    games_finished = Column(SmallInteger)
+    complete_games = Column(SmallInteger)
+    shutouts = Column(SmallInteger)
+    saves = Column(SmallInteger)
+    innings_pitched = Column(REAL)
+    hits_allowed = Column(SmallInteger)
+    runs_allowed = Column(SmallInteger)
+    earned_runs = Column(SmallInteger)
+    home_runs_allowed = Column(SmallInteger)
+    walks_allowed = Column(SmallInteger)
+    intentional_walks_allowed = Column(SmallInteger)
+    strikeouts_pitched = Column(SmallInteger)
+    hit_batters = Column(SmallInteger)
+    balks = Column(SmallInteger)
+    wild_pitches = Column(SmallInteger)
+    batters_faced = Column(SmallInteger)
+    whip = Column(REAL)
+    strikeouts_per_nine = Column(REAL)
+    strikeouts_per_walk = Column(REAL)
     
     # Timestamps
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    __mapper_args__ = {'eager_defaults': False, 'confirm_deleted_rows': False}
+    
+    __table_args__ = (
+        UniqueConstraint("pitcher_id", "season", "split_type", name="uq_pitcher_split"),
+    )
 
 class TeamSplits(Base):
     __tablename__ = 'team_splits'
@@ -890,13 +1070,19 @@ class TeamSplits(Base):
     split_value = Column(String(50), nullable=False)     # Human readable split name
     
     # Team performance stats
-    games = Column(Integer)
-    wins = Column(Integer)
-    losses = Column(Integer)
-    win_percentage = Column(Float)
+    games = Column(SmallInteger)
+    wins = Column(SmallInteger)
+    losses = Column(SmallInteger)
+    win_percentage = Column(REAL)
     
     # Timestamps
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    __mapper_args__ = {'eager_defaults': False, 'confirm_deleted_rows': False}
+    
+    __table_args__ = (
+        Index("ix_team_splits_lookup", "team_id", "season", "split_category", "split_type"),
+    )
 
 
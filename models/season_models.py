@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, Date, Boolean, Text, Float, Numeric, Index
+from sqlalchemy import Column, Computed, Integer, SmallInteger, String, DateTime, Boolean, Float, REAL, Index, func, text
 from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
+from sqlalchemy.ext.hybrid import hybrid_property
 
 Base = declarative_base()
 
+def _innings_from_outs(outs):
+    if outs is None:
+        return None
+    return outs // 3 + (outs % 3) / 10
+
 class PlayerSeasonStats(Base):
     __tablename__ = 'player_season_stats'
     
@@ -16,86 +21,114 @@ class PlayerSeasonStats(Base):
     primary_position = Column(String(50))
     
     # Batting season statistics
-    batting_games_played = Column(Integer)
-    at_bats = Column(Integer)
-    runs = Column(Integer)
-    hits = Column(Integer)
-    doubles = Column(Integer)
-    triples = Column(Integer)
-    home_runs = Column(Integer)
-    rbi = Column(Integer)
-    walks = Column(Integer)
-    strikeouts = Column(Integer)
-    stolen_bases = Column(Integer)
-    caught_stealing = Column(Integer)
-    batting_avg = Column(Float)  # Stored as decimal like .325
-    on_base_pct = Column(Float)
-    slugging_pct = Column(Float)
-    ops = Column(Float)
+    batting_games_played = Column(SmallInteger)
+    at_bats = Column(SmallInteger)
+    runs = Column(SmallInteger)
+    hits = Column(SmallInteger)
+    doubles = Column(SmallInteger)
+    triples = Column(SmallInteger)
+    home_runs = Column(SmallInteger)
+    rbi = Column(SmallInteger)
+    walks = Column(SmallInteger)
+    strikeouts = Column(SmallInteger)
+    stolen_bases = Column(SmallInteger)
+    caught_stealing = Column(SmallInteger)
+    batting_avg = Column(REAL)  # Stored as decimal like .325
+    on_base_pct = Column(REAL)
+    slugging_pct = Column(REAL)
+    ops = Column(REAL)
     plate_appearances = Column(Integer)
-    hit_by_pitch = Column(Integer)
-    sac_flies = Column(Integer)
-    sac_bunts = Column(Integer)
-    intentional_walks = Column(Integer)
-    ground_into_double_play = Column(Integer)
-    total_bases = Column(Integer)
+    hit_by_pitch = Column(SmallInteger)
+    sac_flies = Column(SmallInteger)
+    sac_bunts = Column(SmallInteger)
+    intentional_walks = Column(SmallInteger)
+    ground_into_double_play = Column(SmallInteger)
+    total_bases = Column(SmallInteger)
     
     # Pitching season statistics
-    pitching_games_played = Column(Integer)
-    games_started = Column(Integer)
-    complete_games = Column(Integer)
-    shutouts = Column(Integer)
-    wins = Column(Integer)
-    losses = Column(Integer)
-    saves = Column(Integer)
-    save_opportunities = Column(Integer)
-    holds = Column(Integer)
-    blown_saves = Column(Integer)
-    innings_pitched = Column(Float)  # Can be like 123.1 (123.33)
-    hits_allowed = Column(Integer)
-    runs_allowed = Column(Integer)
-    earned_runs = Column(Integer)
-    home_runs_allowed = Column(Integer)
-    walks_allowed = Column(Integer)
-    hit_batsmen = Column(Integer)
-    pitcher_strikeouts = Column(Integer)
-    wild_pitches = Column(Integer)
-    balks = Column(Integer)
-    era = Column(Float)
-    whip = Column(Float)
-    batters_faced = Column(Integer)
-    pitches_thrown = Column(Integer)
-    strikes = Column(Integer)
-    balls = Column(Integer)
-    strike_percentage = Column(Float)
-    wins_above_replacement = Column(Float)  # WAR if available
+    pitching_games_played = Column(SmallInteger)
+    games_started = Column(SmallInteger)
+    complete_games = Column(SmallInteger)
+    shutouts = Column(SmallInteger)
+    wins = Column(SmallInteger)
+    losses = Column(SmallInteger)
+    saves = Column(SmallInteger)
+    save_opportunities = Column(SmallInteger)
+    holds = Column(SmallInteger)
+    blown_saves = Column(SmallInteger)
+    outs_pitched = Column(SmallInteger)  # 123.1 innings = 370 outs
+    hits_allowed = Column(SmallInteger)
+    runs_allowed = Column(SmallInteger)
+    earned_runs = Column(SmallInteger)
+    home_runs_allowed = Column(SmallInteger)
+    walks_allowed = Column(SmallInteger)
+    hit_batsmen = Column(SmallInteger)
+    pitcher_strikeouts = Column(SmallInteger)
+    wild_pitches = Column(SmallInteger)
+    balks = Column(SmallInteger)
+    era = Column(REAL)
+    whip = Column(REAL)
+    batters_faced = Column(SmallInteger)
+    pitches_thrown = Column(SmallInteger)
+    strikes = Column(SmallInteger)
+    balls = Column(SmallInteger)
+    strike_percentage = Column(REAL)
+    wins_above_replacement = Column(REAL)  # WAR if available
     
     # Fielding season statistics  
-    fielding_games = Column(Integer)
-    fielding_games_started = Column(Integer)
-    innings_fielded = Column(Float)
-    putouts = Column(Integer)
-    assists = Column(Integer)
-    errors = Column(Integer)
-    double_plays = Column(Integer)
-    fielding_percentage = Column(Float)
-    range_factor = Column(Float)
+    fielding_games = Column(SmallInteger)
+    fielding_games_started = Column(SmallInteger)
+    outs_fielded = Column(SmallInteger)
+    putouts = Column(SmallInteger)
+    assists = Column(SmallInteger)
+    errors = Column(SmallInteger)
+    double_plays = Column(SmallInteger)
+    fielding_percentage = Column(REAL)
+    range_factor = Column(REAL)
     
     # Advanced metrics (if available)
-    wrc_plus = Column(Integer)  # Weighted Runs Created Plus
-    war_batting = Column(Float)  # Batting WAR
-    war_pitching = Column(Float)  # Pitching WAR
-    war_fielding = Column(Float)  # Fielding WAR
+    wrc_plus = Column(SmallInteger)  # Weighted Runs Created Plus
+    war_batting = Column(REAL)  # Batting WAR
+    war_pitching = Column(REAL)  # Pitching WAR
+    war_fielding = Column(REAL)  # Fielding WAR
     
     # Metadata
-    last_updated = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    last_updated = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    # Innings in baseball notation (123.1 = 123 1/3) for display; sum and
+    # compare the exact outs columns instead
+    @hybrid_property
+    def innings_pitched(self):
+        return _innings_from_outs(self.outs_pitched)
+    
+    @innings_pitched.expression
+    def innings_pitched(cls):
+        return cls.outs_pitched // 3 + (cls.outs_pitched % 3) * 0.1
+    
+    @hybrid_property
+    def innings_fielded(self):
+        return _innings_from_outs(self.outs_fielded)
+    
+    @innings_fielded.expression
+    def innings_fielded(cls):
+        return cls.outs_fielded // 3 + (cls.outs_fielded % 3) * 0.1
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_player_season_stats_player_season', 'player_id', 'season'),
-        Index('idx_player_season_stats_season', 'season'),
+        # Leaderboards (WHERE season = ? ORDER BY <stat> LIMIT n) read these
+        # in order as index-only scans; they also cover season-only lookups.
+        # Rows are rewritten after every game, so leave room for the updates
+        Index('idx_player_season_stats_season_hr', 'season', 'home_runs',
+              postgresql_include=['player_name'], postgresql_with={'fillfactor': 90}),
+        Index('idx_player_season_stats_season_ops', 'season', 'ops',
+              postgresql_include=['player_name', 'plate_appearances'], postgresql_with={'fillfactor': 90}),
+        Index('idx_player_season_stats_season_era', 'season', 'era',
+              postgresql_include=['player_name', 'outs_pitched'], postgresql_with={'fillfactor': 90}),
         Index('idx_player_season_stats_position', 'primary_position'),
+        # One child table per season (see create_season_partitions); reads
+        # filtered on season only touch that season's partition
+        {'postgresql_partition_by': 'RANGE (season)'}
     )
 
 class TeamSeasonStats(Base):
@@ -118,11 +151,14 @@ class TeamSeasonStats(Base):
     division_name = Column(String(50))  # "American League East"
     
     # Season record
-    games_played = Column(Integer)
+    games_played = Column(Integer, Computed("COALESCE(wins, 0) + COALESCE(losses, 0) + COALESCE(ties, 0)", persisted=True))
     wins = Column(Integer)
     losses = Column(Integer)
     ties = Column(Integer, default=0)
-    winning_percentage = Column(Float)  # .582
+    winning_percentage = Column(Float, Computed(
+        "CASE WHEN COALESCE(wins, 0) + COALESCE(losses, 0) > 0 "
+        "THEN COALESCE(wins, 0)::float8 / (COALESCE(wins, 0) + COALESCE(losses, 0)) ELSE 0 END", persisted=True
+    ))  # .582
     
     # Standings
     division_rank = Column(Integer)
@@ -140,14 +176,14 @@ class TeamSeasonStats(Base):
     # Additional team stats (if available in API)
     runs_scored = Column(Integer)
     runs_allowed = Column(Integer)
-    run_differential = Column(Integer)
+    run_differential = Column(Integer, Computed("runs_scored - runs_allowed", persisted=True))
     home_wins = Column(Integer)
     home_losses = Column(Integer)
     away_wins = Column(Integer)
     away_losses = Column(Integer)
     
     # Streak information
-    current_streak = Column(String(10))  # "W3", "L2", etc.
+    current_streak = Column(SmallInteger)  # +3 for "W3", -2 for "L2"
     longest_win_streak = Column(Integer)
     longest_loss_streak = Column(Integer)
     
@@ -157,14 +193,18 @@ class TeamSeasonStats(Base):
     elimination_number = Column(Integer)  # If available
     
     # Metadata
-    last_updated = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    last_updated = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_team_season_stats_team_season', 'team_id', 'season'),
-        Index('idx_team_season_stats_season', 'season'),
-        Index('idx_team_season_stats_division', 'division_id', 'season'),
-        Index('idx_team_season_stats_league', 'league_id', 'season'),
+        # Season first: standings reads filter on the current season, and
+        # these also cover season-only lookups
+        Index('idx_team_season_stats_division', 'season', 'division_id'),
+        Index('idx_team_season_stats_league', 'season', 'league_id'),
+        # Division leaders: a handful of rows per season
+        Index('idx_team_season_stats_division_leaders', 'season', 'division_id',
+              postgresql_where=text('is_division_leader')),
+        {'postgresql_partition_by': 'RANGE (season)'}
     )
 
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import Column, Computed, DateTime, Integer, MetaData, Table, func
+
+from models import BoxScore, Game, GameLineScore
+from models.database import copy_columns, copy_prices
+
+
+class _Model:
+    __table__ = Table(
+        'copy_columns_probe', MetaData(),
+        Column('id', Integer, primary_key=True),
+        Column('runs', Integer, nullable=False, server_default='0'),
+        Column('runs_doubled', Integer, Computed('runs * 2')),
+        Column('created_at', DateTime(timezone=True), server_default=func.now())
+    )
+
+
+def test_copy_columns_skip_now_defaults():
+    columns = copy_columns(Game)
+    assert 'game_pk' in columns
+    assert 'created_at' not in columns
+    assert 'updated_at' not in columns
+
+
+def test_copy_columns_keep_literal_defaults():
+    assert copy_columns(_Model) == ('id', 'runs')
+
+
+def test_copy_columns_keep_zero_default_counts():
+    box_columns = copy_columns(BoxScore)
+    for name in ('at_bats', 'runs', 'hits', 'rbi', 'walks', 'strikeouts', 'doubles', 'triples', 'home_runs'):
+        assert name in box_columns
+    assert 'created_at' not in box_columns
+
+    line_columns = copy_columns(GameLineScore)
+    for name in ('runs', 'hits', 'errors', 'left_on_base'):
+        assert name in line_columns
+    assert 'created_at' not in line_columns
+
+
+def test_copy_prices_requires_fetched_at():
+    with pytest.raises(ValueError):
+        copy_prices(None, [{'market_id': 1, 'selection_id': '42', 'american_odds': 110}])
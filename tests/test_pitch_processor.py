@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+from etl.processors.game.pitch_processor import PitchDataProcessor, _inning_half
+from models import StatcastPitch
+
+
+class _FakeQuery:
+    def filter_by(self, **kwargs):
+        return self
+
+    def first(self):
+        return None
+
+
+class _FakeSession:
+    """Just enough of a Session for _load_pitch_data"""
+
+    def __init__(self, game):
+        self.game = game
+        self.added = []
+
+    def get(self, model, key):
+        return self.game
+
+    def query(self, *entities):
+        return _FakeQuery()
+
+    def add(self, obj):
+        self.added.append(obj)
+
+
+GAME = SimpleNamespace(
+    season='2025', official_date=None,
+    home_team_id=141, home_team_abbreviation='TOR',
+    away_team_id=147, away_team_abbreviation='NYY'
+)
+
+
+def _load(pitch):
+    session = _FakeSession(GAME)
+    PitchDataProcessor(session)._load_pitch_data({'123': [pitch]}, 1)
+    return [obj for obj in session.added if isinstance(obj, StatcastPitch)][0]
+
+
+def test_bottom_half_pitch_from_teams():
+    pitch = _load({'play_id': 'a', 'pitcher': 1, 'batter': 2, 'inning': 3,
+                   'team_batting': 'TOR', 'team_fielding': 'NYY'})
+    assert pitch.inning_half == 'bottom'
+    assert (pitch.pitcher_team_id, pitch.batter_team_id) == (147, 141)
+
+
+def test_top_half_pitch_from_teams():
+    pitch = _load({'play_id': 'b', 'pitcher': 1, 'batter': 2, 'inning': 3,
+                   'team_batting': 'NYY', 'team_fielding': 'TOR'})
+    assert pitch.inning_half == 'top'
+    assert (pitch.pitcher_team_id, pitch.batter_team_id) == (141, 147)
+
+
+def test_inning_topbot_wins():
+    assert _inning_half({'inning_topbot': 'Bot', 'team_batting': 'NYY'}, 'TOR') == 'bottom'
+    assert _inning_half({'inning_topbot': 'Top'}, 'TOR') == 'top'
+
+
+def test_unknown_half_leaves_teams_empty():
+    pitch = _load({'play_id': 'c', 'pitcher': 1, 'batter': 2})
+    assert pitch.inning_half is None
+    assert pitch.pitcher_team_id is None and pitch.batter_team_id is None